@@ -1,8 +1,12 @@
 from .des import DES
 from .ecc import ECC_GFp, ECC_GF2n
-from .rsa import RSA
+from .rsa import RSA, RSAPrivateKey
 from .tripledes import TripleDES
-from .aes import AES
-from .sha_512 import SHA_512
+from .aes import AES, PreparedAESKey
+from .sha_512 import SHA_512, SHA512, sha512_hash, sha512_many
 from .whirlpool_cipher import WhirlpoolCipher
-from .whirlpool_hash import whirlpool_hash
\ No newline at end of file
+from .whirlpool_hash import whirlpool_hash, Whirlpool
+from .modes import ECB, CBC, CTR, OFB, CFB, ParallelCTR
+from .hash_file import hash_file, hash_files
+from .hmac_sha512 import HMAC_SHA512, hmac_sha512, pbkdf2_hmac_sha512
+from .whirlpool_tree import WhirlpoolTree, whirlpool_tree_hash
\ No newline at end of file
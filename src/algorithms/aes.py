@@ -3,62 +3,239 @@ from utils.aes_general_funcs import *
 from utils.helpers import *
 from algorithms.base import CryptoAlgorithm
 
+class PreparedAESKey:
+    """
+    An AES key expanded once and kept in the layouts the round functions consume.
+    Attributes:
+        key_size (int): Key size in bytes.
+        rounds (int): Number of rounds.
+        round_keys (tuple[bytes]): The rounds + 1 round keys in state layout (state[row * 4 + col]).
+        words (tuple[int]): The same round keys as 32-bit column words, for the T-table rounds.
+        inv_words (tuple[int]): Round key words for the equivalent inverse cipher (reverse order,
+            InvMixColumns applied to the inner rounds), for T-table decryption.
+        round_key_array (np.ndarray): (rounds + 1, 16) uint8 round keys in input byte order, for encrypt_blocks.
+    For the modified 512-bit state (key_size 64), round_keys are 64-byte row-major states, words
+    holds 8 row words per round, and there are no decryption keys or key array.
+    """
+    def __init__(self, key: bytearray, key_size: int, rounds: int):
+        if len(key) != key_size:
+            raise ValueError(f"Invalid AES key. Expected {key_size} bytes, got {len(key)}.")
+        self.key = bytes(key)
+        self.key_size = key_size
+        self.rounds = rounds
+
+        if key_size == SIZE_64:
+            expanded_key = AES_Helpers(key_size).expand_key(key, key_size, SIZE_64 * (rounds + 1))
+            self.round_keys = tuple(bytes(expanded_key[r * SIZE_64:(r + 1) * SIZE_64]) for r in range(rounds + 1))
+            self.words = tuple(tuple(aes_64_bytes_to_rows(round_key)) for round_key in self.round_keys)
+            self.inv_words = None
+            self.round_key_array = None
+            return
+
+        expanded_key = AES_Helpers(key_size).expand_key(key, key_size, 16 * (rounds + 1))
+        self.round_keys = tuple(bytes(AES_Helpers.create_round_key(expanded_key, r)) for r in range(rounds + 1))
+        words = aes_round_key_words(expanded_key)
+        self.words = tuple(words)
+        self.inv_words = tuple(aes_decryption_key_words(words, rounds))
+        self.round_key_array = aes_numpy_round_keys(words)
+
 class AES(CryptoAlgorithm):
     """Implementation of the AES encryption algorithm."""
     
+    backends = ('ttable', 'reference')
+
     #def __init__(self, key_size: int = 128?):
-    def __init__(self, key_size: int = 16):
+    def __init__(self, key_size: int = 16, backend: str = 'ttable'):
+        """
+        Args:
+            key_size (int): Key size in bytes (16, 24, 32, or 64 for the modified 512-bit state).
+            backend (str): 'ttable' runs the table rounds (32-bit column words, or 64-bit row words
+                for the 512-bit state), 'reference' the step-by-step SubBytes/ShiftRows/MixColumns
+                (SubBytes/ShiftColumns/MixRows for the 512-bit state) rounds.
+        """
         super().__init__()
+        if backend not in self.backends:
+            raise ValueError(f"Invalid AES backend. Use one of {', '.join(self.backends)}.")
         self.key_size = key_size
+        # The key_size 64 variant runs on a 64-byte (8x8) state
+        self.block_size = SIZE_64 if key_size == SIZE_64 else 16
+        self.backend = backend
+        self.helpers = AES_Helpers(key_size)
+        # Key set with set_key, and the last key expanded by encrypt/decrypt
+        self.prepared_key = None
+        self._last_key = None
         
     def encrypt(self, input_bytes: bytearray, key: bytearray) -> bytearray:
-        """Encrypt a 16-byte block with AES using the given key."""
-        rounds = {16: 10, 24: 12, 32: 14, 64: 10}.get(self.key_size)
-        if rounds is None:
-            raise ValueError("Invalid AES key size. Use 16, 24, 32 or 64 bytes.")
-        helpers = AES_Helpers(self.key_size)
+        """Encrypt a block (16 bytes, 64 for key_size 64) with AES using the given key (raw bytes or a PreparedAESKey)."""
+        return self.encrypt_block(input_bytes, self._prepared(key))
+
+    def decrypt(self, input_bytes: bytearray, key: bytearray) -> bytearray:
+        """Decrypt a 16-byte block with AES using the given key (raw bytes or a PreparedAESKey)."""
+        return self.decrypt_block(input_bytes, self._prepared(key))
+
+    def expand_key(self, key: bytearray) -> PreparedAESKey:
+        """Expand a key once for repeated encrypt_block/decrypt_block calls.
+        Args:
+            key (bytearray): The key, key_size bytes.
+        Returns:
+            PreparedAESKey: The expanded key, reusable across blocks and mode drivers.
+        """
+        return PreparedAESKey(key, self.key_size, self._rounds())
 
-        expanded_key = helpers.expand_key(key, self.key_size, 16 * (rounds + 1))
+    def set_key(self, key: bytearray) -> PreparedAESKey:
+        """Expand a key and keep it as the default for encrypt_block/decrypt_block and encrypt/decrypt."""
+        self.prepared_key = self.expand_key(key)
+        return self.prepared_key
+
+    def encrypt_block(self, input_bytes: bytearray, expanded_key: PreparedAESKey = None) -> bytearray:
+        """Encrypt a block with a key from expand_key (default: the key from set_key)."""
+        prepared = self._prepared(expanded_key)
+        if self.key_size == SIZE_64:
+            return self._encrypt_block_512(input_bytes, prepared)
+        if self._uses_ttable():
+            return bytearray(aes_ttable_encrypt(input_bytes, prepared.words, prepared.rounds))
+        rounds, round_keys = prepared.rounds, prepared.round_keys
+        helpers = self.helpers
         state = helpers.byte_to_state(input_bytes)
 
         # Initial round key addition
-        state = helpers.add_round_key(state, helpers.create_round_key(expanded_key, 0))
+        state = helpers.add_round_key(state, round_keys[0])
 
         for round_idx in range(1, rounds):
             state = helpers.sub_bytes(state)
             state = helpers.shift_rows(state)
             state = helpers.mix_columns(state)
-            state = helpers.add_round_key(state, helpers.create_round_key(expanded_key, round_idx))
+            state = helpers.add_round_key(state, round_keys[round_idx])
 
         # Final round (no MixColumns)
         state = helpers.sub_bytes(state)
         state = helpers.shift_rows(state)
-        state = helpers.add_round_key(state, helpers.create_round_key(expanded_key, rounds))
+        state = helpers.add_round_key(state, round_keys[rounds])
         
         return helpers.state_to_byte(state)
 
-    def decrypt(self, input_bytes: bytearray, key: bytearray) -> bytearray:
-        """Decrypt a 16-byte block with AES using the given key."""
-        rounds = {16: 10, 24: 12, 32: 14, 64: 10}.get(self.key_size)
-        if rounds is None:
-            raise ValueError("Invalid AES key size. Use 16, 24, 32 or 64 bytes.")
-        helpers = AES_Helpers(self.key_size)
-        
-        expanded_key = helpers.expand_key(key, self.key_size, 16 * (rounds + 1))
+    def decrypt_block(self, input_bytes: bytearray, expanded_key: PreparedAESKey = None) -> bytearray:
+        """Decrypt a 16-byte block with a key from expand_key (default: the key from set_key)."""
+        self._check_decryptable()
+        prepared = self._prepared(expanded_key)
+        if self._uses_ttable():
+            return bytearray(aes_ttable_decrypt(input_bytes, prepared.inv_words, prepared.rounds))
+        rounds, round_keys = prepared.rounds, prepared.round_keys
+        helpers = self.helpers
         state = helpers.byte_to_state(input_bytes)
 
         # Initial round key addition
-        state = helpers.add_round_key(state, helpers.create_round_key(expanded_key, rounds))
+        state = helpers.add_round_key(state, round_keys[rounds])
         
         for round_idx in range(rounds - 1, 0, -1):
             state = helpers.inv_shift_rows(state)
             state = helpers.inv_sub_bytes(state)
-            state = helpers.add_round_key(state, helpers.create_round_key(expanded_key, round_idx))
+            state = helpers.add_round_key(state, round_keys[round_idx])
             state = helpers.inv_mix_columns(state)
         
         # Final round (no InvMixColumns)
         state = helpers.inv_shift_rows(state)
         state = helpers.inv_sub_bytes(state)
-        state = helpers.add_round_key(state, helpers.create_round_key(expanded_key, 0))
+        state = helpers.add_round_key(state, round_keys[0])
 
         return helpers.state_to_byte(state)
+
+    def _encrypt_block_512(self, input_bytes: bytearray, prepared: PreparedAESKey) -> bytearray:
+        """Encrypt a 64-byte block of the modified 512-bit state variant."""
+        if len(input_bytes) != SIZE_64:
+            raise ValueError("Invalid AES input. The 512-bit state variant takes 64-byte blocks.")
+        if self.backend == 'ttable':
+            return bytearray(aes_64_encrypt_rows(input_bytes, prepared.words, prepared.rounds))
+
+        rounds, round_keys = prepared.rounds, prepared.round_keys
+        helpers = self.helpers
+        state = helpers.byte_to_state(input_bytes)
+
+        # Initial round key addition
+        state = helpers.add_round_key(state, round_keys[0])
+
+        for round_idx in range(1, rounds):
+            state = helpers.sub_bytes(state)
+            state = helpers.shift_cols(state)
+            state = helpers.mix_rows(state)
+            state = helpers.add_round_key(state, round_keys[round_idx])
+
+        # Final round (no MixRows)
+        state = helpers.sub_bytes(state)
+        state = helpers.shift_cols(state)
+        state = helpers.add_round_key(state, round_keys[rounds])
+
+        return helpers.state_to_byte(state)
+
+    def encrypt_blocks(self, blocks, key=None, lanes: int = 65536):
+        """Encrypt many blocks at once with the NumPy rounds (ECB).
+        Args:
+            blocks (np.ndarray or bytes): (N, block_size) uint8 array, or a buffer of block_size-byte blocks.
+            key (bytearray or PreparedAESKey): The key (default: the key from set_key).
+            lanes (int): Number of blocks advanced through the rounds together.
+        Returns:
+            np.ndarray or bytes: The encrypted blocks, in the same form as blocks.
+        """
+        return self._process_blocks(blocks, key, aes_numpy_encrypt, lanes)
+
+    def decrypt_blocks(self, blocks, key=None, lanes: int = 65536):
+        """Decrypt many blocks at once with the NumPy rounds (ECB).
+        Args:
+            blocks (np.ndarray or bytes): (N, 16) uint8 array, or a buffer of 16-byte blocks.
+            key (bytearray or PreparedAESKey): The key (default: the key from set_key).
+            lanes (int): Number of blocks advanced through the rounds together.
+        Returns:
+            np.ndarray or bytes: The decrypted blocks, in the same form as blocks.
+        """
+        self._check_decryptable()
+        return self._process_blocks(blocks, key, aes_numpy_decrypt, lanes)
+
+    def _process_blocks(self, blocks, key, engine, lanes: int):
+        bs = self.block_size
+        prepared = self._prepared(key)
+        as_array = isinstance(blocks, np.ndarray)
+        if as_array:
+            if blocks.ndim != 2 or blocks.shape[1] != bs:
+                raise ValueError(f"Invalid AES input. Array must have shape (N, {bs}).")
+            array = blocks.astype(np.uint8, copy=False)
+        else:
+            if len(blocks) % bs != 0:
+                raise ValueError(f"Invalid AES input. Buffer length must be a multiple of {bs} bytes.")
+            array = np.frombuffer(bytes(blocks), dtype=np.uint8).reshape(-1, bs)
+
+        if self.key_size == SIZE_64:
+            # No array rounds for the 512-bit state: run the row-word engine block by block
+            processed = np.frombuffer(b''.join(self.encrypt_block(block.tobytes(), prepared) for block in array),
+                                      dtype=np.uint8).reshape(-1, bs)
+            return processed if as_array else processed.tobytes()
+
+        processed = np.empty_like(array)
+        for start in range(0, len(array), lanes):
+            processed[start:start + lanes] = engine(array[start:start + lanes], prepared.round_key_array, prepared.rounds)
+        return processed if as_array else processed.tobytes()
+
+    def _prepared(self, key) -> PreparedAESKey:
+        """Resolve a raw key or PreparedAESKey, reusing the last expansion when the key repeats."""
+        if key is None:
+            if self.prepared_key is None:
+                raise ValueError("No AES key set. Call set_key or pass a key.")
+            return self.prepared_key
+        if isinstance(key, PreparedAESKey):
+            return key
+        if self._last_key is None or self._last_key.key != key:
+            self._last_key = self.expand_key(key)
+        return self._last_key
+
+    def _rounds(self) -> int:
+        rounds = {16: 10, 24: 12, 32: 14, 64: 10}.get(self.key_size)
+        if rounds is None:
+            raise ValueError("Invalid AES key size. Use 16, 24, 32 or 64 bytes.")
+        return rounds
+
+    def _check_decryptable(self):
+        if self.key_size == SIZE_64:
+            # aes_64_sbox has repeated entries, so SubBytes cannot be undone
+            raise ValueError("Invalid AES operation. The 512-bit state variant has no inverse S-box and cannot decrypt.")
+
+    def _uses_ttable(self) -> bool:
+        return self.backend == 'ttable'
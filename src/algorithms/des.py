@@ -1,11 +1,15 @@
 from utils.des_helpers import *
 from utils.helpers import *
 from algorithms.base import CryptoAlgorithm
+import struct
 
 class DES(CryptoAlgorithm):
-    def __init__(self, key_size: int = 56):
+    def __init__(self, key_size: int = 56, key_cache: DESKeyScheduleCache = None):
         super().__init__()
         self.key_size = key_size
+        self.block_size = 8
+        # Expanded RoundKeys are looked up here instead of being regenerated on every call
+        self.key_cache = key_cache if key_cache is not None else des_key_schedule_cache
 
     def encrypt(self, plaintext: str, key: str, print_round_text = False, print_initial_permutation = False) -> str:
         """Encrypt the plaintext using the DES algorithm.
@@ -16,25 +20,11 @@ class DES(CryptoAlgorithm):
         Returns:
             str: The encrypted ciphertext (64 bits)
         """
-        permuted_plaintext = des_permute(plaintext, des_initial_permutation, 64)
-        if print_initial_permutation:
-            print(f"After initial permutation: {bin2hex(permuted_plaintext)}")
-        left, right = split_half(permuted_plaintext)
-
-        # Generate the 16 keys for each round   
-        keys = des_key_generation(key)
+        # Get the 16 keys for each round
+        keys = self.key_cache.encryption_keys(bin2dec(key))
+        ciphertext = self._process_block(bin2dec(plaintext), keys, print_round_text, print_initial_permutation)
+        return dec2bin(ciphertext, 64)
 
-        for round in range(16):
-            left, right = des_mixer(left, right, keys[round])
-            if round != 15:
-                left, right = swap_half(left, right)
-            if print_round_text:
-                print(f"Round {round + 1}: L: {bin2hex(left)}, R: {bin2hex(right)}, Key: {bin2hex(keys[round])}")
-
-        combined = des_combine(left, right)
-        permuted_ciphertext = des_permute(combined, des_final_permutation, 64)
-        return permuted_ciphertext
-    
     def decrypt(self, ciphertext: str, key: str, print_round_text = False, print_initial_permutation = False) -> str:
         """Decrypt the ciphertext using the DES algorithm.
         Args:
@@ -44,21 +34,143 @@ class DES(CryptoAlgorithm):
         Returns:
             str: The decrypted plaintext (64 bits)
         """
-        permuted_ciphertext = des_permute(ciphertext, des_initial_permutation, 64)
+        # Get the 16 keys for each round, in reverse order
+        keys = self.key_cache.decryption_keys(bin2dec(key))
+        plaintext = self._process_block(bin2dec(ciphertext), keys, print_round_text, print_initial_permutation)
+        return dec2bin(plaintext, 64)
+
+    def encrypt_int(self, plaintext: int, key: int) -> int:
+        """Encrypt a 64-bit block given as an integer with a 64-bit integer key."""
+        return des_process_block_int(plaintext, self.key_cache.encryption_keys(key))
+
+    def decrypt_int(self, ciphertext: int, key: int) -> int:
+        """Decrypt a 64-bit block given as an integer with a 64-bit integer key."""
+        return des_process_block_int(ciphertext, self.key_cache.decryption_keys(key))
+
+    def encrypt_bytes(self, plaintext: bytes, key: bytes) -> bytes:
+        """Encrypt an 8-byte block with an 8-byte key."""
+        self._check_block_bytes(plaintext, key)
+        block = self.encrypt_int(int.from_bytes(plaintext, 'big'), int.from_bytes(key, 'big'))
+        return block.to_bytes(8, 'big')
+
+    def decrypt_bytes(self, ciphertext: bytes, key: bytes) -> bytes:
+        """Decrypt an 8-byte block with an 8-byte key."""
+        self._check_block_bytes(ciphertext, key)
+        block = self.decrypt_int(int.from_bytes(ciphertext, 'big'), int.from_bytes(key, 'big'))
+        return block.to_bytes(8, 'big')
+
+    def expand_key(self, key) -> tuple[tuple[int, ...], tuple[int, ...]]:
+        """Expand a key once for repeated encrypt_block/decrypt_block calls.
+        Args:
+            key (int or bytes): The key (64 bits).
+        Returns:
+            tuple: RoundKeys in encryption order and in decryption order.
+        """
+        if isinstance(key, (bytes, bytearray)):
+            if len(key) != 8:
+                raise ValueError(f"Invalid DES key. Expected 8 bytes, got {len(key)}.")
+            key = int.from_bytes(key, 'big')
+        elif not isinstance(key, int) or not 0 <= key <= MAX_64BIT:
+            raise ValueError("Invalid DES key. Expected 8 bytes or an integer in [0, 2^64).")
+        return self.key_cache.get(key)
+
+    def encrypt_block(self, block: bytes, expanded_key) -> bytes:
+        """Encrypt an 8-byte block with a key from expand_key."""
+        return des_process_block_int(int.from_bytes(block, 'big'), expanded_key[0]).to_bytes(8, 'big')
+
+    def decrypt_block(self, block: bytes, expanded_key) -> bytes:
+        """Decrypt an 8-byte block with a key from expand_key."""
+        return des_process_block_int(int.from_bytes(block, 'big'), expanded_key[1]).to_bytes(8, 'big')
+
+    def encrypt_many(self, blocks, key, lanes: int = 4096):
+        """Encrypt many blocks under one key with the bitsliced engine (ECB).
+        Args:
+            blocks (list[int] or bytes): 64-bit blocks, or a buffer of 8-byte blocks.
+            key (int or bytes): The key (64 bits).
+            lanes (int): Number of blocks processed together in one batch.
+        Returns:
+            list[int] or bytes: The encrypted blocks, in the same form as blocks.
+        """
+        return self._process_many(blocks, key, self.key_cache.encryption_keys, lanes)
+
+    def decrypt_many(self, blocks, key, lanes: int = 4096):
+        """Decrypt many blocks under one key with the bitsliced engine (ECB).
+        Args:
+            blocks (list[int] or bytes): 64-bit blocks, or a buffer of 8-byte blocks.
+            key (int or bytes): The key (64 bits).
+            lanes (int): Number of blocks processed together in one batch.
+        Returns:
+            list[int] or bytes: The decrypted blocks, in the same form as blocks.
+        """
+        return self._process_many(blocks, key, self.key_cache.decryption_keys, lanes)
+
+    def encrypt_many_keys(self, block, keys: list, lanes: int = 4096) -> list[int]:
+        """Encrypt one block under many keys with the bitsliced engine (e.g. exhaustive key search).
+        Args:
+            block (int or bytes): The block to encrypt (64 bits).
+            keys (list[int] or list[bytes]): The keys to try (64 bits each).
+            lanes (int): Number of keys processed together in one batch.
+        Returns:
+            list[int]: The ciphertext under each key, in the order of keys.
+        """
+        if isinstance(block, (bytes, bytearray)):
+            block = int.from_bytes(block, 'big')
+        keys = [int.from_bytes(key, 'big') if isinstance(key, (bytes, bytearray)) else key for key in keys]
+
+        ciphertexts = []
+        for start in range(0, len(keys), lanes):
+            batch = keys[start:start + lanes]
+            ones = (1 << len(batch)) - 1
+            # The key schedule only moves bits, so the RoundKey slices are key slices reindexed
+            key_slices = des_bitslice(batch, 64)
+            round_key_slices = [[key_slices[pos - 1] for pos in positions] for positions in des_round_key_slice_positions]
+            block_slices = [ones if (block >> (63 - j)) & 1 else 0 for j in range(64)]
+            ciphertexts += des_unbitslice(des_process_slices(block_slices, round_key_slices, ones), len(batch))
+        return ciphertexts
+
+    @staticmethod
+    def _process_many(blocks, key, schedule, lanes: int):
+        if isinstance(key, (bytes, bytearray)):
+            key = int.from_bytes(key, 'big')
+        as_bytes = isinstance(blocks, (bytes, bytearray, memoryview))
+        if as_bytes:
+            if len(blocks) % 8 != 0:
+                raise ValueError("Invalid DES input. Buffer length must be a multiple of 8 bytes.")
+            blocks = struct.unpack(f'>{len(blocks) // 8}Q', blocks)
+
+        RoundKeys = schedule(key)
+        processed = []
+        for start in range(0, len(blocks), lanes):
+            batch = blocks[start:start + lanes]
+            ones = (1 << len(batch)) - 1
+            round_key_slices = [[ones if (RoundKey >> (47 - bit)) & 1 else 0 for bit in range(48)] for RoundKey in RoundKeys]
+            processed += des_unbitslice(des_process_slices(des_bitslice(batch, 64), round_key_slices, ones), len(batch))
+
+        if as_bytes:
+            return struct.pack(f'>{len(processed)}Q', *processed)
+        return processed
+
+    @staticmethod
+    def _check_block_bytes(block: bytes, key: bytes):
+        if len(block) != 8 or len(key) != 8:
+            raise ValueError("Invalid DES input. Block and key must be 8 bytes.")
+
+    @staticmethod
+    def _process_block(block: int, keys: tuple[int, ...], print_round_text = False, print_initial_permutation = False) -> int:
+        """Run a block through the integer engine, printing the round text if requested."""
+        if not (print_round_text or print_initial_permutation):
+            return des_process_block_int(block, keys)
+
+        permuted = des_ip_compiled(block)
         if print_initial_permutation:
-            print(f"After initial permutation: {bin2hex(permuted_ciphertext)}")
-        left, right = split_half(permuted_ciphertext)
+            print(f"After initial permutation: {permuted:016X}")
+        left, right = permuted >> 32, permuted & MASK_32BIT
 
-        # Generate the 16 keys for each round
-        keys = des_key_generation(key)
-        keys.reverse()
         for round in range(16):
-            left, right = des_mixer(left, right, keys[round])
+            left ^= des_function_int(right, keys[round])
             if round != 15:
-                left, right = swap_half(left, right)
+                left, right = right, left
             if print_round_text:
-                print(f"Round {round + 1}: L: {bin2hex(left)}, R: {bin2hex(right)}, Key: {bin2hex(keys[round])}")
-        
-        combined = des_combine(left, right)
-        permuted_plaintext = des_permute(combined, des_final_permutation, 64)
-        return permuted_plaintext
\ No newline at end of file
+                print(f"Round {round + 1}: L: {left:08X}, R: {right:08X}, Key: {keys[round]:012X}")
+
+        return des_fp_compiled((left << 32) | right)
@@ -14,8 +14,8 @@ class ECC_GFp(CryptoAlgorithm):
         self.public_key = None # Our public key
         self.recipient_public_key = None # Recipient's public key for encryption
     
-    def set_curve(self, a: int, b: int, p: int, G: Tuple[int, int], n: int):
-        self.curve = EllipticCurveGFp(a, b, p)
+    def set_curve(self, a: int, b: int, p: int, G: Tuple[int, int], n: int, montgomery: bool = False):
+        self.curve = EllipticCurveGFp(a, b, p, montgomery)
         self.G = G
         self.n = n
     
@@ -0,0 +1,59 @@
+from algorithms.sha_512 import SHA512
+from algorithms.whirlpool_hash import Whirlpool
+from concurrent.futures import ProcessPoolExecutor
+import mmap
+import os
+import time
+
+HASH_ALGORITHMS = {
+    'whirlpool': Whirlpool,
+    'sha512': SHA512,
+}
+
+def hash_file(path: str, algorithm: str = 'whirlpool') -> bytes:
+    """
+    Hash a file through mmap: the compression function reads blocks straight out of the mapping
+    via memoryview, so the file is neither read into memory nor copied block by block.
+    Args:
+        path (str): File to hash.
+        algorithm (str): 'whirlpool' or 'sha512'.
+    Returns:
+        bytes: The digest.
+    """
+    if algorithm not in HASH_ALGORITHMS:
+        raise ValueError(f"Invalid hash algorithm. Use one of {', '.join(HASH_ALGORITHMS)}.")
+    hasher = HASH_ALGORITHMS[algorithm]()
+    with open(path, 'rb') as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    hasher.update(view)
+    return hasher.digest()
+
+def _timed_hash_file(path: str, algorithm: str) -> dict:
+    start = time.perf_counter()
+    try:
+        digest = hash_file(path, algorithm)
+        size = os.path.getsize(path)
+    except OSError as e:
+        # One unreadable file must not abort the others
+        return {'path': path, 'digest': None, 'size': None, 'seconds': None, 'error': e.strerror or str(e)}
+    return {'path': path, 'digest': digest.hex(), 'size': size,
+            'seconds': time.perf_counter() - start, 'error': None}
+
+def hash_files(paths: list[str], algorithm: str = 'whirlpool', workers: int = 1) -> list[dict]:
+    """
+    Hash several files, optionally one per worker process.
+    Args:
+        paths (list[str]): Files to hash.
+        algorithm (str): 'whirlpool' or 'sha512'.
+        workers (int): Number of processes (1 hashes in this process).
+    Returns:
+        list[dict]: Per file, in the order of paths: path, digest (hex), size (bytes), seconds and
+            error (None, or the OSError message; digest, size and seconds are then None).
+    """
+    if workers <= 1 or len(paths) <= 1:
+        return [_timed_hash_file(path, algorithm) for path in paths]
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        return list(pool.map(_timed_hash_file, paths, [algorithm] * len(paths)))
@@ -0,0 +1,113 @@
+from algorithms.sha_512 import SHA512
+from utils.sha512_helpers import sha512_compress
+import struct
+
+IPAD, OPAD = 0x36, 0x5C
+
+class HMAC_SHA512:
+    """
+    HMAC-SHA512 (RFC 2104) with the hashlib-style interface (update/digest/hexdigest/copy).
+    The inner and outer hash states after the key ^ ipad / key ^ opad block are computed once per
+    key; every message starts from copies of them, so each MAC costs only the message blocks plus
+    one outer block.
+    """
+    name = 'hmac-sha512'
+    digest_size = 64
+    block_size = 128
+
+    def __init__(self, key: bytes, message: bytes = b''):
+        inner, outer = hmac_sha512_pad_states(key)
+        self._inner_start, self._outer_start = inner, outer
+        self._inner = inner.copy()
+        if message:
+            self.update(message)
+
+    @property
+    def inner_state(self) -> list[int]:
+        """SHA-512 chaining value right after the key ^ ipad block."""
+        return list(self._inner_start._H)
+
+    @property
+    def outer_state(self) -> list[int]:
+        """SHA-512 chaining value right after the key ^ opad block."""
+        return list(self._outer_start._H)
+
+    def update(self, data: bytes):
+        self._inner.update(data)
+
+    def digest(self) -> bytes:
+        outer = self._outer_start.copy()
+        outer.update(self._inner.digest())
+        return outer.digest()
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+    def copy(self) -> 'HMAC_SHA512':
+        other = HMAC_SHA512.__new__(HMAC_SHA512)
+        other._inner_start, other._outer_start = self._inner_start, self._outer_start
+        other._inner = self._inner.copy()
+        return other
+
+    def new(self, message: bytes = b'') -> 'HMAC_SHA512':
+        """Fresh MAC under the same key, reusing the precomputed pad states."""
+        other = HMAC_SHA512.__new__(HMAC_SHA512)
+        other._inner_start, other._outer_start = self._inner_start, self._outer_start
+        other._inner = self._inner_start.copy()
+        if message:
+            other.update(message)
+        return other
+
+def _padded_key(key: bytes) -> bytes:
+    """HMAC block key: hashed if longer than a block, then zero-padded to the block size."""
+    if len(key) > SHA512.block_size:
+        key = SHA512(key).digest()
+    return bytes(key).ljust(SHA512.block_size, b'\x00')
+
+def hmac_sha512_pad_states(key: bytes) -> tuple[SHA512, SHA512]:
+    """SHA512 states after absorbing key ^ ipad and key ^ opad (keys longer than a block are hashed first)."""
+    key = _padded_key(key)
+    return SHA512(bytes(b ^ IPAD for b in key)), SHA512(bytes(b ^ OPAD for b in key))
+
+def hmac_sha512(key: bytes, message: bytes) -> bytes:
+    """One-shot HMAC-SHA512."""
+    return HMAC_SHA512(key, message).digest()
+
+# Final block for a 64-byte message after one 128-byte pad block: 0x80, zeros, length 192 * 8 bits
+_DIGEST_BLOCK_TAIL = [0x8000000000000000, 0, 0, 0, 0, 0, 0, (128 + 64) * 8]
+
+def pbkdf2_hmac_sha512(password: bytes, salt: bytes, iterations: int, dklen: int = None) -> bytes:
+    """
+    PBKDF2-HMAC-SHA512 (RFC 8018).
+    The ipad/opad chaining values are computed once for all blocks and iterations, and every
+    U_i = HMAC(password, U_{i-1}) runs as exactly two compressions on 64-bit words.
+    Args:
+        password (bytes): The password.
+        salt (bytes): The salt.
+        iterations (int): Iteration count.
+        dklen (int): Derived key length in bytes (default: 64).
+    Returns:
+        bytes: The derived key.
+    """
+    if iterations < 1:
+        raise ValueError("Invalid PBKDF2 iteration count. It must be at least 1.")
+    if dklen is None:
+        dklen = SHA512.digest_size
+    if dklen < 1:
+        raise ValueError("Invalid PBKDF2 key length. It must be at least 1.")
+
+    mac = HMAC_SHA512(password)
+    # Chaining values right after the pad blocks, for the word-level iterations
+    inner_H, outer_H = mac.inner_state, mac.outer_state
+
+    blocks = []
+    for index in range(1, -(-dklen // SHA512.digest_size) + 1):
+        # U_1 = HMAC(password, salt || INT(index)), through the general HMAC path
+        U = list(struct.unpack('>8Q', mac.new(salt + index.to_bytes(4, 'big')).digest()))
+        T = list(U)
+
+        for _ in range(iterations - 1):
+            U = sha512_compress(outer_H, sha512_compress(inner_H, U + _DIGEST_BLOCK_TAIL) + _DIGEST_BLOCK_TAIL)
+            T = [t ^ u for t, u in zip(T, U)]
+        blocks.append(struct.pack('>8Q', *T))
+    return b''.join(blocks)[:dklen]
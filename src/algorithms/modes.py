@@ -0,0 +1,342 @@
+from utils.helpers import pad_data, unpad_data
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union
+import os
+
+class BlockMode(ABC):
+    """
+    Base class for the block cipher modes of operation.
+    Works on top of any block primitive exposing block_size, expand_key, encrypt_block
+    and decrypt_block (DES, TripleDES, AES). The key is expanded once per mode object and
+    reused by every encryptor/decryptor and every block.
+    """
+    uses_padding = False
+    needs_iv = True
+
+    def __init__(self, algo, key, iv: bytes = None, padding: bool = None):
+        """
+        Args:
+            algo: The block primitive (DES, TripleDES or AES instance).
+            key: The key, in any form accepted by algo.expand_key.
+            iv (bytes): Initialization vector (initial counter block for CTR), block_size bytes.
+            padding (bool): Apply PKCS#7 padding (default: True for ECB/CBC, unsupported for stream modes).
+        """
+        self.algo = algo
+        self.block_size = algo.block_size
+        self.expanded_key = algo.expand_key(key)
+
+        if self.needs_iv:
+            if iv is None or len(iv) != self.block_size:
+                raise ValueError(f"{type(self).__name__} needs an IV of {self.block_size} bytes.")
+            iv = bytes(iv)
+        self.iv = iv
+
+        if padding is None:
+            padding = self.uses_padding
+        if padding and not self.uses_padding:
+            raise ValueError(f"{type(self).__name__} is a stream mode and does not use padding.")
+        self.padding = padding
+
+    def encryptor(self) -> 'ModeContext':
+        """Return a streaming encryption context (update/finalize)."""
+        return ModeContext(self, encrypting=True)
+
+    def decryptor(self) -> 'ModeContext':
+        """Return a streaming decryption context (update/finalize)."""
+        return ModeContext(self, encrypting=False)
+
+    def encrypt(self, data: Union[str, bytes]) -> bytes:
+        """Encrypt a whole message in one call."""
+        context = self.encryptor()
+        return context.update(data) + context.finalize()
+
+    def decrypt(self, data: bytes) -> bytes:
+        """Decrypt a whole message in one call."""
+        context = self.decryptor()
+        return context.update(data) + context.finalize()
+
+    def initial_state(self) -> int:
+        """Chaining value at the start of a message."""
+        return int.from_bytes(self.iv, 'big') if self.iv is not None else 0
+
+    @abstractmethod
+    def process_blocks(self, data: bytes, state: int, encrypting: bool) -> tuple[bytes, int]:
+        """Process whole blocks. Returns the output and the new chaining value."""
+        pass
+
+    def process_tail(self, data: bytes, state: int, encrypting: bool) -> bytes:
+        """Process a final partial block (stream modes only)."""
+        raise ValueError(f"{type(self).__name__} input must be a multiple of {self.block_size} bytes.")
+
+class ModeContext:
+    """
+    Incremental encryption/decryption of one message.
+    Only the chaining value and less than two blocks of input are kept between
+    update() calls, so arbitrarily large inputs run in bounded memory.
+    """
+    def __init__(self, mode: BlockMode, encrypting: bool):
+        self.mode = mode
+        self.encrypting = encrypting
+        self._state = mode.initial_state()
+        self._buffer = bytearray()
+        self._finalized = False
+
+    def update(self, data: Union[str, bytes]) -> bytes:
+        """Feed more data and return the output for every block completed so far."""
+        if self._finalized:
+            raise ValueError("Context already finalized.")
+        if isinstance(data, str):
+            data = data.encode()
+        self._buffer += data
+
+        block_size = self.mode.block_size
+        n = len(self._buffer) - len(self._buffer) % block_size
+        # When unpadding, the last full block may be the padding: hold it back for finalize()
+        if not self.encrypting and self.mode.padding and n == len(self._buffer):
+            n -= block_size
+        if n <= 0:
+            return b''
+
+        chunk = bytes(self._buffer[:n])
+        del self._buffer[:n]
+        output, self._state = self.mode.process_blocks(chunk, self._state, self.encrypting)
+        return output
+
+    def finalize(self) -> bytes:
+        """Process what is left (padding included) and close the context."""
+        if self._finalized:
+            raise ValueError("Context already finalized.")
+        self._finalized = True
+        tail = bytes(self._buffer)
+        self._buffer.clear()
+
+        if self.mode.padding:
+            if self.encrypting:
+                output, self._state = self.mode.process_blocks(pad_data(tail, self.mode.block_size), self._state, True)
+                return output
+            if len(tail) != self.mode.block_size:
+                raise ValueError(f"Ciphertext length must be a multiple of {self.mode.block_size} bytes.")
+            output, self._state = self.mode.process_blocks(tail, self._state, False)
+            return unpad_data(output)
+
+        if not tail:
+            return b''
+        return self.mode.process_tail(tail, self._state, self.encrypting)
+
+class ECB(BlockMode):
+    """Electronic Codebook: every block is processed independently."""
+    uses_padding = True
+    needs_iv = False
+
+    def __init__(self, algo, key, padding: bool = None):
+        super().__init__(algo, key, padding=padding)
+
+    def process_blocks(self, data, state, encrypting):
+        bs, key = self.block_size, self.expanded_key
+        bulk = _bulk_engine(self.algo, encrypting, len(data) // bs)
+        if bulk is not None:
+            return bulk(bytes(data), key), state
+        process = self.algo.encrypt_block if encrypting else self.algo.decrypt_block
+        return b''.join(bytes(process(data[i:i + bs], key)) for i in range(0, len(data), bs)), state
+
+class CBC(BlockMode):
+    """Cipher Block Chaining: C_i = E(P_i ^ C_{i-1}), C_0 = IV."""
+    uses_padding = True
+
+    def process_blocks(self, data, state, encrypting):
+        bs, key = self.block_size, self.expanded_key
+        output = []
+        if encrypting:
+            for i in range(0, len(data), bs):
+                block = (int.from_bytes(data[i:i + bs], 'big') ^ state).to_bytes(bs, 'big')
+                ciphertext = bytes(self.algo.encrypt_block(block, key))
+                state = int.from_bytes(ciphertext, 'big')
+                output.append(ciphertext)
+        else:
+            for i in range(0, len(data), bs):
+                block = data[i:i + bs]
+                plaintext = int.from_bytes(self.algo.decrypt_block(block, key), 'big') ^ state
+                state = int.from_bytes(block, 'big')
+                output.append(plaintext.to_bytes(bs, 'big'))
+        return b''.join(output), state
+
+class CTR(BlockMode):
+    """Counter: keystream E(IV + i), the IV is the initial counter block (incremented mod 2^(8*block_size))."""
+
+    def keystream(self, counter: int, n_blocks: int) -> tuple[bytes, int]:
+        """Keystream for n_blocks starting at counter. Returns the keystream and the next counter."""
+        return ctr_keystream(self.algo, self.expanded_key, counter, n_blocks)
+
+    def process_blocks(self, data, state, encrypting):
+        stream, state = self.keystream(state, len(data) // self.block_size)
+        return _xor_bytes(data, stream), state
+
+    def process_tail(self, data, state, encrypting):
+        stream, _ = self.keystream(state, 1)
+        return _xor_bytes(data, stream[:len(data)])
+
+class OFB(BlockMode):
+    """Output Feedback: O_i = E(O_{i-1}), O_0 = IV, output = input ^ O_i."""
+
+    def process_blocks(self, data, state, encrypting):
+        bs, key = self.block_size, self.expanded_key
+        stream = []
+        for _ in range(len(data) // bs):
+            state = int.from_bytes(self.algo.encrypt_block(state.to_bytes(bs, 'big'), key), 'big')
+            stream.append(state.to_bytes(bs, 'big'))
+        return _xor_bytes(data, b''.join(stream)), state
+
+    def process_tail(self, data, state, encrypting):
+        stream = self.algo.encrypt_block(state.to_bytes(self.block_size, 'big'), self.expanded_key)
+        return _xor_bytes(data, bytes(stream[:len(data)]))
+
+class CFB(BlockMode):
+    """Cipher Feedback (full block): C_i = P_i ^ E(C_{i-1}), C_0 = IV."""
+
+    def process_blocks(self, data, state, encrypting):
+        bs, key = self.block_size, self.expanded_key
+        output = []
+        for i in range(0, len(data), bs):
+            block = int.from_bytes(data[i:i + bs], 'big')
+            stream = int.from_bytes(self.algo.encrypt_block(state.to_bytes(bs, 'big'), key), 'big')
+            result = block ^ stream
+            state = result if encrypting else block
+            output.append(result.to_bytes(bs, 'big'))
+        return b''.join(output), state
+
+    def process_tail(self, data, state, encrypting):
+        stream = self.algo.encrypt_block(state.to_bytes(self.block_size, 'big'), self.expanded_key)
+        return _xor_bytes(data, bytes(stream[:len(data)]))
+
+# Below this many blocks the per-block path is faster than setting up the array rounds
+BULK_MIN_BLOCKS = 32
+
+def _bulk_engine(algo, encrypting: bool, n_blocks: int):
+    """The primitive's many-blocks-at-once ECB path (AES encrypt_blocks/decrypt_blocks), if it has one and it pays off."""
+    if n_blocks < BULK_MIN_BLOCKS:
+        return None
+    return getattr(algo, 'encrypt_blocks' if encrypting else 'decrypt_blocks', None)
+
+def ctr_keystream(algo, expanded_key, counter: int, n_blocks: int) -> tuple[bytes, int]:
+    """CTR keystream for n_blocks starting at counter. Returns the keystream and the next counter."""
+    bs = algo.block_size
+    mask = (1 << (8 * bs)) - 1
+    bulk = _bulk_engine(algo, True, n_blocks)
+    if bulk is not None:
+        counters = b''.join(((counter + i) & mask).to_bytes(bs, 'big') for i in range(n_blocks))
+        return bulk(counters, expanded_key), (counter + n_blocks) & mask
+    blocks = []
+    for _ in range(n_blocks):
+        blocks.append(bytes(algo.encrypt_block(counter.to_bytes(bs, 'big'), expanded_key)))
+        counter = (counter + 1) & mask
+    return b''.join(blocks), counter
+
+def ctr_xor(algo, expanded_key, data: bytes, counter: int) -> bytes:
+    """XOR data (any length) with the CTR keystream starting at counter."""
+    n_blocks = -(-len(data) // algo.block_size)
+    stream, _ = ctr_keystream(algo, expanded_key, counter, n_blocks)
+    return _xor_bytes(data, stream[:len(data)])
+
+# Set once per worker process by the pool initializer, so key schedules are not sent with every chunk
+_worker_cipher = None
+
+def _init_ctr_worker(algo, expanded_key):
+    global _worker_cipher
+    _worker_cipher = (algo, expanded_key)
+
+def _ctr_worker_chunk(data: bytes, counter: int) -> bytes:
+    algo, expanded_key = _worker_cipher
+    return ctr_xor(algo, expanded_key, data, counter)
+
+class ParallelCTR:
+    """
+    CTR mode spread over a process pool.
+    The input is split into chunks of chunk_size bytes; chunk i starts at counter
+    IV + i * chunk_size / block_size, so the chunks are independent and the output equals CTR.
+    The expanded key is sent to each worker once, by the pool initializer.
+    Use it as a context manager to keep the pool alive across calls.
+    """
+    def __init__(self, algo, key, iv: bytes, workers: int = None, chunk_size: int = 1 << 20):
+        """
+        Args:
+            algo: The block primitive (DES, TripleDES or AES instance).
+            key: The key, in any form accepted by algo.expand_key.
+            iv (bytes): Initial counter block, block_size bytes.
+            workers (int): Number of worker processes (default: os.cpu_count()).
+            chunk_size (int): Bytes per task, rounded down to a multiple of block_size.
+        """
+        self.algo = algo
+        self.block_size = algo.block_size
+        if iv is None or len(iv) != self.block_size:
+            raise ValueError(f"ParallelCTR needs an IV of {self.block_size} bytes.")
+        self.counter = int.from_bytes(iv, 'big')
+        self.expanded_key = algo.expand_key(key)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(self.block_size, chunk_size - chunk_size % self.block_size)
+        self._pool = None
+
+    def __enter__(self):
+        self._pool = self._new_pool()
+        return self
+
+    def __exit__(self, *exc):
+        self._pool.shutdown()
+        self._pool = None
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_ctr_worker,
+                                   initargs=(self.algo, self.expanded_key))
+
+    def _counter_at(self, offset: int) -> int:
+        return (self.counter + offset // self.block_size) % (1 << (8 * self.block_size))
+
+    def encrypt(self, data: bytes) -> bytes:
+        """Encrypt a buffer (CTR: also decrypts)."""
+        data = memoryview(data)
+        offsets = range(0, len(data), self.chunk_size)
+        if self.workers == 1 or len(offsets) <= 1:
+            return b''.join(ctr_xor(self.algo, self.expanded_key, bytes(data[i:i + self.chunk_size]), self._counter_at(i))
+                            for i in offsets)
+
+        chunks = [bytes(data[i:i + self.chunk_size]) for i in offsets]
+        counters = [self._counter_at(i) for i in offsets]
+        pool = self._pool or self._new_pool()
+        try:
+            return b''.join(pool.map(_ctr_worker_chunk, chunks, counters))
+        finally:
+            if pool is not self._pool:
+                pool.shutdown()
+
+    decrypt = encrypt
+
+    def encrypt_file(self, src_path: str, dst_path: str) -> int:
+        """
+        Encrypt (or decrypt) a file into another, in bounded memory: at most
+        2 * workers chunks are read ahead, and results are written in order.
+        Returns:
+            int: Number of bytes processed.
+        """
+        pool = self._pool or self._new_pool()
+        pending, offset = deque(), 0
+        try:
+            with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+                while True:
+                    chunk = src.read(self.chunk_size)
+                    if chunk:
+                        pending.append(pool.submit(_ctr_worker_chunk, chunk, self._counter_at(offset)))
+                        offset += len(chunk)
+                    while pending and (not chunk or len(pending) >= 2 * self.workers):
+                        dst.write(pending.popleft().result())
+                    if not chunk:
+                        return offset
+        finally:
+            if pool is not self._pool:
+                pool.shutdown()
+
+    decrypt_file = encrypt_file
+
+def _xor_bytes(a: bytes, b: bytes) -> bytes:
+    """XOR two byte strings of the same length."""
+    return (int.from_bytes(a, 'big') ^ int.from_bytes(b, 'big')).to_bytes(len(a), 'big')
@@ -1,40 +1,95 @@
 from utils.helpers import *
 from algorithms.base import CryptoAlgorithm
+from concurrent.futures import ProcessPoolExecutor
 from typing import List
 
+class RSAPrivateKey(tuple):
+    """
+    RSA private key. It unpacks like the plain (d, n) tuple, and when the primes are known it
+    also keeps the CRT parameters, so the private operation runs modulo p and q separately.
+    Attributes:
+        d (int): Private exponent.
+        n (int): Modulus.
+        p, q (int): The prime factors of n (None if unknown).
+        dP (int): d mod (p - 1).
+        dQ (int): d mod (q - 1).
+        qInv (int): q^-1 mod p.
+    """
+    def __new__(cls, d: int, n: int, p: int = None, q: int = None):
+        key = super().__new__(cls, (d, n))
+        key.d, key.n, key.p, key.q = d, n, p, q
+        if p is not None and q is not None:
+            if p * q != n:
+                raise ValueError("Invalid RSA private key. p * q must equal n.")
+            key.dP, key.dQ, key.qInv = d % (p - 1), d % (q - 1), multiplicative_inverse(q, p)
+        else:
+            key.dP = key.dQ = key.qInv = None
+        return key
+
+    def __getnewargs__(self):
+        return (self.d, self.n, self.p, self.q)
+
+    @property
+    def has_crt(self) -> bool:
+        return self.qInv is not None
+
+def _rsa_public_blocks(blocks: list[int], e: int, n: int) -> list[int]:
+    return [advanceMod_window(m, e, n) for m in blocks]
+
+def _rsa_private_blocks(blocks: list[int], private_key) -> list[int]:
+    return [RSA._private_op(c, private_key) for c in blocks]
+
 class RSA(CryptoAlgorithm):
     def __init__(self):
         super().__init__()
 
-    def generate_keys(self, p, q):
+    def generate_keys(self, p, q, e = 65537):
         """Generate RSA public and private keys based on two prime numbers.
         Args:
             p (int): First prime number.
             q (int): Second prime number.
+            e (int): Public exponent. If None, the smallest e coprime to phi(n) is used.
         Returns:
-            tuple: Public and private keys.
+            tuple: Public key (e, n) and private key (an RSAPrivateKey, which unpacks as (d, n)).
         """
 
-        if not (sympy.isprime(p) and sympy.isprime(q)) or p == q:
+        if not (is_probable_prime(p) and is_probable_prime(q)) or p == q:
             print("Both numbers must be seperated primes.")
             return None, None
 
         n = p * q
         phi_n = (p - 1) * (q - 1)
 
-        e = None
-        for i in range(2, phi_n):
-            if binary_gcd(i, phi_n) == 1:
-                e = i
-                break
-        
+        if e is None:
+            for i in range(2, phi_n):
+                if binary_gcd(i, phi_n) == 1:
+                    e = i
+                    break
+        elif binary_gcd(e, phi_n) != 1:
+            print("e must be coprime to phi(n).")
+            return None, None
+
         d = multiplicative_inverse(e, phi_n)
 
         public_key = (e, n)
-        private_key = (d, n)
+        private_key = RSAPrivateKey(d, n, p, q)
 
         return public_key, private_key
 
+    def generate_key_pair(self, modulus_bits = 2048, e = 65537, workers = 1):
+        """Generate a fresh RSA key pair with a modulus of exactly modulus_bits bits.
+        Args:
+            modulus_bits (int): Size of n in bits (e.g. 2048, 3072, 4096).
+            e (int): Public exponent; p - 1 and q - 1 are chosen coprime to it.
+            workers (int): If above 1, p and q are searched for in parallel processes.
+        Returns:
+            tuple: Public key (e, n) and private key (an RSAPrivateKey).
+        """
+        if modulus_bits < 16 or modulus_bits % 2:
+            raise ValueError("Invalid RSA modulus size. It must be an even number of bits, at least 16.")
+        p, q = generate_prime_pair(modulus_bits // 2, e=e, workers=workers)
+        return self.generate_keys(p, q, e)
+
     def encrypt(self, msg, public_key, text = False, one_at_a_time = True):
         """Encrypt a message using the RSA algorithm.
         Args:
@@ -50,9 +105,11 @@ class RSA(CryptoAlgorithm):
         pt = text_to_z26(msg, one_at_a_time=one_at_a_time)
 
         if isinstance(pt, List):
-            encrypted = [advanceMod_SM(num, e, n) for num in pt]
+            # One character at a time, so each distinct character is exponentiated only once
+            table = {num: advanceMod_window(num, e, n) for num in set(pt)}
+            encrypted = [table[num] for num in pt]
         elif isinstance(pt, int):
-            encrypted = advanceMod_SM(pt, e, n)
+            encrypted = advanceMod_window(pt, e, n)
         else:
             raise ValueError("Invalid plaintext format. Expected int or list of int.")
         
@@ -62,25 +119,22 @@ class RSA(CryptoAlgorithm):
         """Decrypt a message using the RSA algorithm.
         Args:
             ciphertext (int or list): The ciphertext to decrypt.
-            private_key (tuple): The private key (d, n).
+            private_key (tuple): The private key (d, n), or an RSAPrivateKey (CRT is used when it has p and q).
             text (bool): If True, return the decrypted message as a string.
             one_at_a_time (bool): If True, decrypt one character at a time. If False,
         Returns:
             str or list: The decrypted message as a string or a list of integers.
         """
-        d, n = private_key
         decrypted = []
 
         if isinstance(cipher, list):
-            decrypted = []
-            for ct in cipher:
-                pt = advanceMod_SM(ct, d, n)
-                decrypted.append(pt)
+            table = {ct: self._private_op(ct, private_key) for ct in set(cipher)}
+            decrypted = [table[ct] for ct in cipher]
             if text:
                 decrypted = ''.join(map(lambda x: z26_to_char(x), decrypted))
 
         elif isinstance(cipher, int):
-            pt_int = advanceMod_SM(cipher, d, n)
+            pt_int = self._private_op(cipher, private_key)
             pt_numerical_str = str(pt_int)
 
             if len(pt_numerical_str) % 2 != 0:
@@ -95,4 +149,81 @@ class RSA(CryptoAlgorithm):
         else:
             raise ValueError("Invalid ciphertext format. Expected int or list of int.")
 
-        return decrypted
\ No newline at end of file
+        return decrypted
+
+    def encrypt_bytes(self, data: bytes, public_key, workers: int = 1) -> bytes:
+        """Encrypt bytes: each block carries k - 11 bytes of data (k = modulus size in bytes) with
+        PKCS#1 v1.5 padding, and becomes one k-byte ciphertext block.
+        Args:
+            data (bytes): The message.
+            public_key (tuple): The public key (e, n).
+            workers (int): If above 1, the exponentiations are spread over that many processes.
+        Returns:
+            bytes: The ciphertext, a multiple of k bytes.
+        """
+        e, n = public_key
+        k = (n.bit_length() + 7) // 8
+        if k < 12:
+            raise ValueError("Invalid RSA modulus. encrypt_bytes needs at least a 12-byte modulus.")
+        step = k - 11
+        blocks = [int.from_bytes(rsa_pkcs1_pad(data[i:i + step], k), 'big') for i in range(0, len(data), step)]
+        encrypted = self._map_blocks(_rsa_public_blocks, blocks, (e, n), workers)
+        return b''.join(c.to_bytes(k, 'big') for c in encrypted)
+
+    def decrypt_bytes(self, data: bytes, private_key, workers: int = 1) -> bytes:
+        """Decrypt the output of encrypt_bytes.
+        Args:
+            data (bytes): The ciphertext, a multiple of k bytes.
+            private_key (tuple): The private key (d, n), or an RSAPrivateKey (CRT is used when it has p and q).
+            workers (int): If above 1, the exponentiations are spread over that many processes.
+        Returns:
+            bytes: The message.
+        """
+        n = private_key[1]
+        k = (n.bit_length() + 7) // 8
+        if len(data) % k != 0:
+            raise ValueError(f"Invalid RSA ciphertext. Length must be a multiple of {k} bytes.")
+        blocks = [int.from_bytes(data[i:i + k], 'big') for i in range(0, len(data), k)]
+        if any(c >= n for c in blocks):
+            raise ValueError("Invalid RSA ciphertext. Block out of range.")
+        decrypted = self._map_blocks(_rsa_private_blocks, blocks, (private_key,), workers)
+        return b''.join(rsa_pkcs1_unpad(m.to_bytes(k, 'big')) for m in decrypted)
+
+    @staticmethod
+    def _map_blocks(func, blocks: list[int], args: tuple, workers: int) -> list[int]:
+        """func(batch, *args) over all blocks, in this process or in batches over a process pool."""
+        if workers <= 1 or len(blocks) < 2 * workers:
+            return func(blocks, *args)
+        # A few batches per worker keeps them busy without pickling one task per block
+        size = -(-len(blocks) // (4 * workers))
+        batches = [blocks[i:i + size] for i in range(0, len(blocks), size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(func, batches, *[[arg] * len(batches) for arg in args])
+            return [value for batch in results for value in batch]
+
+    def sign(self, msg, private_key):
+        """Sign a message representative (or a list of them) with the private key.
+        Args:
+            msg (int or list): Integer(s) smaller than n.
+            private_key (tuple): The private key (d, n), or an RSAPrivateKey (CRT is used when it has p and q).
+        Returns:
+            int or list: The signature(s).
+        """
+        if isinstance(msg, list):
+            return [self._private_op(m, private_key) for m in msg]
+        return self._private_op(msg, private_key)
+
+    def verify(self, msg, signature, public_key) -> bool:
+        """Check signature(s) from sign against the message representative(s)."""
+        e, n = public_key
+        if isinstance(msg, list):
+            return len(msg) == len(signature) and all(advanceMod_window(s, e, n) == m % n for m, s in zip(msg, signature))
+        return advanceMod_window(signature, e, n) == msg % n
+
+    @staticmethod
+    def _private_op(c: int, private_key) -> int:
+        """c^d mod n, through CRT with Garner recombination when the key carries p and q."""
+        if isinstance(private_key, RSAPrivateKey) and private_key.has_crt:
+            return crt_mod_exp(c, private_key.p, private_key.q, private_key.dP, private_key.dQ, private_key.qInv)
+        d, n = private_key
+        return advanceMod_window(c, d, n)
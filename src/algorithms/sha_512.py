@@ -1,11 +1,13 @@
 from utils.sha512_helpers import *
 from utils.helpers import *
+import numpy as np
+import struct
 
 class SHA_512():
     def __init__(self, verbose = 0):
         self.verbose = verbose
         self.numRounds = NUM_ROUNDS
-        self.H =  H_const
+        self.H = list(H_const)  # per-instance copy, H_const is never modified
         self.y = 0
         self.x = 0
         self.a = 0
@@ -103,8 +105,105 @@ class SHA_512():
     def sha512_W_schedule(self, block):
         for i in range(16):
             self.W[i] = block[i]
-            
-    
-        
-            
-        
\ No newline at end of file
+
+
+class SHA512:
+    """
+    SHA-512 with the hashlib interface (update/digest/hexdigest/copy).
+    State is per instance: the chaining value, a partial-block buffer and the byte count.
+    Whole blocks are unpacked in bulk straight from the input buffer.
+    """
+    name = 'sha512'
+    digest_size = 64
+    block_size = 128
+    # Blocks unpacked per struct call
+    unpack_blocks = 512
+
+    def __init__(self, data: bytes = b''):
+        self._H = list(H_const)
+        self._buffer = bytearray()
+        self._length = 0  # bytes hashed so far
+        if data:
+            self.update(data)
+
+    def update(self, data: bytes):
+        """Hash more data (any bytes-like object)."""
+        view = memoryview(data).cast('B')
+        self._length += len(view)
+
+        # Complete a pending partial block first
+        if self._buffer:
+            take = min(self.block_size - len(self._buffer), len(view))
+            self._buffer += view[:take]
+            view = view[take:]
+            if len(self._buffer) < self.block_size:
+                return
+            self._H = self._compress_blocks(self._H, self._buffer, 1)
+            self._buffer = bytearray()
+
+        n_blocks = len(view) // self.block_size
+        self._H = self._compress_blocks(self._H, view, n_blocks)
+        self._buffer = bytearray(view[n_blocks * self.block_size:])
+
+    def digest(self) -> bytes:
+        """Digest of the data so far; the object can keep being updated."""
+        tail = sha512_pad(bytes(self._buffer), self._length)
+        H = self._compress_blocks(self._H, tail, len(tail) // self.block_size)
+        return struct.pack('>8Q', *H)
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+    def copy(self) -> 'SHA512':
+        """Independent copy of the current state (e.g. to hash several messages sharing a prefix)."""
+        other = SHA512.__new__(SHA512)
+        other._H = list(self._H)
+        other._buffer = bytearray(self._buffer)
+        other._length = self._length
+        return other
+
+    @classmethod
+    def _compress_blocks(cls, H: list[int], data, n_blocks: int) -> list[int]:
+        """Compress the first n_blocks blocks of data, unpacking big-endian words unpack_blocks blocks at a time."""
+        for first in range(0, n_blocks, cls.unpack_blocks):
+            count = min(cls.unpack_blocks, n_blocks - first)
+            words = struct.unpack_from(f'>{16 * count}Q', data, first * cls.block_size)
+            for i in range(0, 16 * count, 16):
+                H = sha512_compress(H, words[i:i + 16])
+        return H
+
+def sha512_hash(message: bytes) -> bytes:
+    """One-shot SHA-512 digest of message."""
+    return SHA512(message).digest()
+
+def sha512_many(messages: list, lanes: int = 65536) -> list[bytes]:
+    """
+    SHA-512 of many messages at once on NumPy uint64 lanes, one lane per message.
+    Messages are padded and grouped by block count, and each group runs through the rounds together.
+    Args:
+        messages (list[bytes]): The messages (any bytes-like objects).
+        lanes (int): Maximum number of messages hashed together.
+    Returns:
+        list[bytes]: The digests, in the order of messages.
+    """
+    padded = [sha512_pad(bytes(message)) for message in messages]
+    groups = {}
+    for i, message in enumerate(padded):
+        groups.setdefault(len(message) // 128, []).append(i)
+
+    digests = [None] * len(messages)
+    for n_blocks, indices in groups.items():
+        for start in range(0, len(indices), lanes):
+            batch = indices[start:start + lanes]
+            # One row of 16 * n_blocks big-endian words per message
+            words = np.frombuffer(b''.join(padded[i] for i in batch), dtype='>u8').astype(np.uint64)
+            words = words.reshape(len(batch), 16 * n_blocks)
+
+            H = [np.full(len(batch), h, dtype=np.uint64) for h in H_const]
+            for b in range(n_blocks):
+                H = sha512_compress_lanes(H, np.ascontiguousarray(words[:, 16 * b:16 * (b + 1)].T))
+
+            output = np.stack(H, axis=1).astype('>u8').tobytes()
+            for j, i in enumerate(batch):
+                digests[i] = output[64 * j:64 * (j + 1)]
+    return digests
@@ -5,9 +5,11 @@ from algorithms.des import DES
 import hashlib
 
 class TripleDES(CryptoAlgorithm):
-    def __init__(self):
+    def __init__(self, key_cache: DESKeyScheduleCache = None):
         super().__init__()
-        self.des = DES()
+        # The three keys share the DES key schedule cache (the module-wide one by default)
+        self.des = DES(key_cache=key_cache)
+        self.block_size = 8
 
     def mutate_key(self, original_key: str, seed: int) -> str:
         """
@@ -68,4 +70,38 @@ class TripleDES(CryptoAlgorithm):
         # Step 3: Decrypt with K1
         plaintext = self.des.decrypt(step2, k1, print_round_text)
 
-        return plaintext
\ No newline at end of file
+        return plaintext
+
+    def expand_key(self, key) -> tuple:
+        """
+        Expand a 3DES key once for repeated encrypt_block/decrypt_block calls.
+        Args:
+            key (bytes or tuple): k1 || k2 (|| k3) as 16 or 24 bytes, or a tuple of 2 or 3 DES keys (int or bytes)
+        Returns:
+            tuple: The three expanded DES keys (k3 = k1 in 2-key mode)
+        """
+        if isinstance(key, (bytes, bytearray)):
+            if len(key) not in (16, 24):
+                raise ValueError("Invalid 3DES key size. Use 16 or 24 bytes.")
+            key = tuple(key[i:i + 8] for i in range(0, len(key), 8))
+        elif len(key) not in (2, 3):
+            raise ValueError("Invalid 3DES key count. Use a tuple of 2 or 3 DES keys.")
+        if len(key) == 2:
+            key = (key[0], key[1], key[0])  # 2-key mode
+        return tuple(self.des.expand_key(k) for k in key)
+
+    def encrypt_block(self, block: bytes, expanded_key) -> bytes:
+        """Encrypt an 8-byte block (EDE) with a key from expand_key."""
+        k1, k2, k3 = expanded_key
+        value = des_process_block_int(int.from_bytes(block, 'big'), k1[0])
+        value = des_process_block_int(value, k2[1])
+        value = des_process_block_int(value, k3[0])
+        return value.to_bytes(8, 'big')
+
+    def decrypt_block(self, block: bytes, expanded_key) -> bytes:
+        """Decrypt an 8-byte block (DED) with a key from expand_key."""
+        k1, k2, k3 = expanded_key
+        value = des_process_block_int(int.from_bytes(block, 'big'), k3[1])
+        value = des_process_block_int(value, k2[0])
+        value = des_process_block_int(value, k1[1])
+        return value.to_bytes(8, 'big')
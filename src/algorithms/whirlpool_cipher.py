@@ -1,7 +1,9 @@
-from utils.aes_helpers import AES_Helpers
-from utils.aes_general_funcs import aes_64_Rcon, SIZE_64
+from utils.aes_general_funcs import aes_64_Rcon, aes_64_C, aes_64_bytes_to_rows, aes_64_rows_to_bytes, aes_64_row_round, SIZE_64
 from algorithms.base import CryptoAlgorithm
 
+# Round constants as row words: RC[r] has aes_64_Rcon[r - 1] in row 0 and zeros elsewhere
+WHIRLPOOL_RC_ROWS = [[int.from_bytes(bytes(rc), 'big')] + [0] * 7 for rc in aes_64_Rcon]
+
 class WhirlpoolCipher(CryptoAlgorithm):
     def __init__(self):
         self.block_size = SIZE_64  # 64 bytes = 512 bits
@@ -9,20 +11,25 @@ class WhirlpoolCipher(CryptoAlgorithm):
 
     def encrypt(self, plaintext: bytearray, key: bytearray) -> bytearray:
         """Encrypt a 512-bit block with Whirlpool using the given 512-bit key."""
-
-        helpers = AES_Helpers(self.block_size)
-        state = bytearray(plaintext)
-        round_keys = self.key_expansion(key)
-
+        round_keys = self.key_expansion_rows(aes_64_bytes_to_rows(key))
+        return bytearray(aes_64_rows_to_bytes(self.encrypt_rows(aes_64_bytes_to_rows(plaintext), round_keys)))
+
+    def encrypt_rows(self, rows: list[int], round_keys: list[list[int]]) -> list[int]:
+        """
+        Encrypt a state given as 8 row words (see aes_64_bytes_to_rows).
+        Each round, SubBytes + ShiftColumns + MixRows + AddRoundKey, is 64 lookups in the C0..C7 tables (aes_64_C).
+        Args:
+            rows (list[int]): The state as 8 row words.
+            round_keys (list[list[int]]): Round keys from key_expansion_rows.
+        Returns:
+            list[int]: The encrypted state as 8 row words.
+        """
         # Pre-round transformation
-        state = helpers.add_round_key(state, bytearray(round_keys[0]))
+        state = [row ^ k for row, k in zip(rows, round_keys[0])]
 
         # 10 rounds
         for round in range(1, self.rounds + 1):
-            state = helpers.sub_bytes(state)
-            state = helpers.shift_cols(state)
-            state = helpers.mix_rows(state)
-            state = helpers.add_round_key(state, round_keys[round])
+            state = aes_64_row_round(state, aes_64_C, round_keys[round])
 
         return state
     
@@ -30,20 +37,15 @@ class WhirlpoolCipher(CryptoAlgorithm):
         pass
 
     def key_expansion(self, key: bytearray) -> list:
-        helpers = AES_Helpers(self.block_size)
-        round_keys = [key[:]]  # K0 = input cipherkey
+        """Round keys K0..K10 as 64-byte states."""
+        return [bytearray(aes_64_rows_to_bytes(k)) for k in self.key_expansion_rows(aes_64_bytes_to_rows(key))]
 
-        for round in range(1, self.rounds + 1):
-            k = round_keys[-1][:]
-            k = helpers.sub_bytes(k)
-            k = helpers.shift_cols(k)
-            k = helpers.mix_rows(k)
-
-            rc = bytearray(64)
-            rc[0:8] = aes_64_Rcon[round - 1] 
+    def key_expansion_rows(self, key_rows: list[int]) -> list[list[int]]:
+        """Round keys K0..K10 as 8 row words each."""
+        round_keys = [list(key_rows)]  # K0 = input cipherkey
 
-            # K[i] = K[i-1] ⊕ RC[i] ⊕ γ(K[i-1])
-            k = bytearray([k[j] ^ rc[j] for j in range(64)])
-            round_keys.append(k)
+        for round in range(1, self.rounds + 1):
+            # K[i] = γ(K[i-1]) ⊕ RC[i]
+            round_keys.append(aes_64_row_round(round_keys[-1], aes_64_C, WHIRLPOOL_RC_ROWS[round - 1]))
 
         return round_keys
@@ -1,20 +1,84 @@
 from algorithms.whirlpool_cipher import WhirlpoolCipher
+from utils.aes_general_funcs import aes_64_rows_to_bytes
 from utils.helpers import whirlpool_pad
+import struct
 
-def whirlpool_hash(message: bytes) -> bytes:
+_whirlpool_cipher = WhirlpoolCipher()
+
+def whirlpool_compress(H: list[int], data, offset: int = 0) -> list[int]:
+    """
+    Miyaguchi-Preneel step: H' = E_H(M) ^ M ^ H for the 64-byte block of data at offset.
+    Args:
+        H (list[int]): Chaining value as 8 row words.
+        data (bytes-like): Buffer holding the block.
+        offset (int): Start of the block in data.
+    Returns:
+        list[int]: The new chaining value.
+    """
+    block = struct.unpack_from('>8Q', data, offset)
+    # Encrypt with key as H
+    C = _whirlpool_cipher.encrypt_rows(block, _whirlpool_cipher.key_expansion_rows(H))
+    # XOR with C, H and M
+    return [C[j] ^ block[j] ^ H[j] for j in range(8)]
+
+class Whirlpool:
+    """
+    Streaming Whirlpool with the hashlib interface (update/digest/hexdigest/copy).
+    Only the chaining value and a partial block are kept, so memory use does not grow with the input.
+    """
+    name = 'whirlpool'
+    digest_size = 64
+    block_size = 64
+
+    def __init__(self, data: bytes = b''):
+        self._H = [0] * 8
+        self._buffer = bytearray()
+        self._length = 0  # bytes hashed so far
+        if data:
+            self.update(data)
 
-    # Padding
-    padded = whirlpool_pad(message)
+    def update(self, data: bytes):
+        """Hash more data (any bytes-like object)."""
+        view = memoryview(data).cast('B')
+        self._length += len(view)
 
-    H = bytearray(64)
-    whirlpool_cipher = WhirlpoolCipher()
+        # Complete a pending partial block first
+        if self._buffer:
+            take = min(self.block_size - len(self._buffer), len(view))
+            self._buffer += view[:take]
+            view = view[take:]
+            if len(self._buffer) < self.block_size:
+                return
+            self._H = whirlpool_compress(self._H, self._buffer)
+            self._buffer = bytearray()
 
-    for i in range(0, len(padded), 64):
-        block = padded[i:i+64]
+        # Then whole blocks straight from the input, without copying it
+        end = len(view) - len(view) % self.block_size
+        H = self._H
+        for offset in range(0, end, self.block_size):
+            H = whirlpool_compress(H, view, offset)
+        self._H = H
+        self._buffer = bytearray(view[end:])
 
-        # Encrypt with key as H
-        C = whirlpool_cipher.encrypt(block, H)
-        # XOR with C, H and 
-        H = bytearray([C[j] ^ block[j] ^ H[j] for j in range(64)])
+    def digest(self) -> bytes:
+        """Digest of the data so far; the object can keep being updated."""
+        tail = whirlpool_pad(bytes(self._buffer), self._length)
+        H = self._H
+        for offset in range(0, len(tail), self.block_size):
+            H = whirlpool_compress(H, tail, offset)
+        return aes_64_rows_to_bytes(H)
 
-    return bytes(H)
\ No newline at end of file
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+    def copy(self) -> 'Whirlpool':
+        """Independent copy of the current state (e.g. to hash several messages sharing a prefix)."""
+        other = Whirlpool.__new__(Whirlpool)
+        other._H = list(self._H)
+        other._buffer = bytearray(self._buffer)
+        other._length = self._length
+        return other
+
+def whirlpool_hash(message: bytes) -> bytes:
+    """One-shot Whirlpool digest of message."""
+    return Whirlpool(message).digest()
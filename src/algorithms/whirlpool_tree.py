@@ -0,0 +1,152 @@
+from algorithms.whirlpool_hash import Whirlpool, whirlpool_hash
+from concurrent.futures import ProcessPoolExecutor
+import mmap
+import os
+
+# Tree (Merkle-style) hashing over Whirlpool, so one large input can be hashed on several cores.
+#
+# Layout, for a leaf size L and an input of n bytes:
+#   - Leaves: chunk i is bytes [i * L, (i + 1) * L) of the input (the last chunk may be shorter;
+#     an empty input has one empty chunk). leaf_i = whirlpool_hash(0x00 || chunk_i).
+#   - Inner levels: node j of the next level = whirlpool_hash(0x01 || node_2j || node_2j+1); a last
+#     node without a sibling is carried up unchanged. Levels are built until one node remains.
+#   - Root: whirlpool_hash(0x02 || L as 8 bytes || n as 8 bytes || top node), all big-endian.
+# The 0x00/0x01/0x02 prefixes keep leaves, inner nodes and the root from colliding with each other,
+# and the root binds the leaf size and length, so the same data under another L hashes differently.
+
+LEAF_PREFIX, NODE_PREFIX, ROOT_PREFIX = b'\x00', b'\x01', b'\x02'
+
+def whirlpool_tree_leaf(chunk) -> bytes:
+    """Digest of one leaf chunk."""
+    hasher = Whirlpool(LEAF_PREFIX)
+    hasher.update(chunk)
+    return hasher.digest()
+
+def whirlpool_tree_node(children: list[bytes]) -> bytes:
+    """Digest of an inner node from its child digests."""
+    return whirlpool_hash(NODE_PREFIX + b''.join(children))
+
+def _hash_file_leaf(path: str, offset: int, size: int) -> bytes:
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        return whirlpool_tree_leaf(f.read(size))
+
+class WhirlpoolTree:
+    """
+    A Whirlpool hash tree: every level of digests plus the root (see the layout above).
+    Build it with WhirlpoolTree.build(source) and, after changing some chunks, get the new tree
+    with tree.rehash(source, changed), which only rehashes those chunks and their paths to the root.
+    A source is a bytes-like object or a file path (read through mmap).
+    """
+    def __init__(self, leaf_size: int, length: int, levels: list[list[bytes]]):
+        self.leaf_size = leaf_size
+        self.length = length
+        self.levels = levels  # levels[0] are the leaves, levels[-1] is the single top node
+        self.root = whirlpool_hash(ROOT_PREFIX + leaf_size.to_bytes(8, 'big') + length.to_bytes(8, 'big') + levels[-1][0])
+
+    @property
+    def leaves(self) -> list[bytes]:
+        return self.levels[0]
+
+    def digest(self) -> bytes:
+        return self.root
+
+    def hexdigest(self) -> str:
+        return self.root.hex()
+
+    @classmethod
+    def build(cls, source, leaf_size: int = 1 << 20, workers: int = 1) -> 'WhirlpoolTree':
+        """
+        Hash a whole input.
+        Args:
+            source (bytes-like or str): The data, or the path of a file.
+            leaf_size (int): Chunk size in bytes.
+            workers (int): Processes hashing leaves in parallel (1 hashes in this process).
+        Returns:
+            WhirlpoolTree: The tree.
+        """
+        if leaf_size < 1:
+            raise ValueError("Invalid leaf size. It must be at least 1 byte.")
+        length = _source_length(source)
+        n_leaves = max(1, -(-length // leaf_size))
+        leaves = _hash_leaves(source, leaf_size, range(n_leaves), workers)
+        return cls(leaf_size, length, cls._build_levels(leaves, None, set(range(n_leaves))))
+
+    def rehash(self, source, changed, workers: int = 1) -> 'WhirlpoolTree':
+        """
+        Tree of a modified input, reusing every digest that the changes cannot affect.
+        Args:
+            source (bytes-like or str): The new data, or the path of a file.
+            changed (iterable[int]): Indices of the chunks that changed. Chunks past the old end
+                (and the old last chunk, if the length changed) are rehashed anyway.
+            workers (int): Processes hashing leaves in parallel.
+        Returns:
+            WhirlpoolTree: The new tree (this one is left as it was).
+        """
+        length = _source_length(source)
+        n_leaves = max(1, -(-length // self.leaf_size))
+        dirty = {i for i in changed if 0 <= i < n_leaves}
+        if length != self.length:
+            dirty |= set(range(min(len(self.leaves), n_leaves) - 1, n_leaves))
+
+        leaves = self.leaves[:n_leaves] + [None] * (n_leaves - len(self.leaves))
+        for i, digest in zip(sorted(dirty), _hash_leaves(source, self.leaf_size, sorted(dirty), workers)):
+            leaves[i] = digest
+        return WhirlpoolTree(self.leaf_size, length, self._build_levels(leaves, self.levels, dirty))
+
+    @staticmethod
+    def _build_levels(leaves: list[bytes], old_levels, dirty: set[int]) -> list[list[bytes]]:
+        """Build the inner levels, recomputing only the nodes above dirty ones when old levels are given."""
+        levels = [leaves]
+        depth = 0
+        while len(levels[-1]) > 1:
+            below = levels[-1]
+            n_nodes = -(-len(below) // 2)
+            old = old_levels[depth + 1] if old_levels is not None and depth + 1 < len(old_levels) else []
+            old_below = len(old_levels[depth]) if old_levels is not None and depth < len(old_levels) else 0
+            dirty = {i // 2 for i in dirty}
+            # A length change moves which node is last (and unpaired) at this level
+            if len(below) != old_below:
+                dirty |= set(range(max(0, min(old_below, len(below)) // 2 - 1), n_nodes))
+            level = []
+            for j in range(n_nodes):
+                if j in dirty or j >= len(old):
+                    level.append(whirlpool_tree_node(below[2 * j:2 * j + 2]) if 2 * j + 1 < len(below) else below[2 * j])
+                else:
+                    level.append(old[j])
+            levels.append(level)
+            depth += 1
+        return levels
+
+def whirlpool_tree_hash(source, leaf_size: int = 1 << 20, workers: int = 1) -> bytes:
+    """Root digest of the Whirlpool hash tree of a bytes-like object or a file path."""
+    return WhirlpoolTree.build(source, leaf_size, workers).root
+
+def _source_length(source) -> int:
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    return memoryview(source).nbytes
+
+def _hash_leaves(source, leaf_size: int, indices, workers: int) -> list[bytes]:
+    """Leaf digests of the given chunk indices, in order."""
+    indices = list(indices)
+    is_path = isinstance(source, (str, os.PathLike))
+
+    if workers > 1 and len(indices) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(indices))) as pool:
+            if is_path:
+                # Workers read their own chunks, so file data is not pickled across processes
+                offsets = [i * leaf_size for i in indices]
+                return list(pool.map(_hash_file_leaf, [os.fspath(source)] * len(indices), offsets, [leaf_size] * len(indices)))
+            view = memoryview(source).cast('B')
+            return list(pool.map(whirlpool_tree_leaf, [bytes(view[i * leaf_size:(i + 1) * leaf_size]) for i in indices]))
+
+    if is_path:
+        with open(source, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return [whirlpool_tree_leaf(b'') for _ in indices]
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return [whirlpool_tree_leaf(view[i * leaf_size:(i + 1) * leaf_size]) for i in indices]
+    view = memoryview(source).cast('B')
+    return [whirlpool_tree_leaf(view[i * leaf_size:(i + 1) * leaf_size]) for i in indices]
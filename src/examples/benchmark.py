@@ -0,0 +1,254 @@
+import os
+import random
+import sys
+import time
+
+from algorithms import AES, DES, RSA, RSAPrivateKey, ParallelCTR, SHA_512, whirlpool_hash, sha512_hash, sha512_many, hmac_sha512, pbkdf2_hmac_sha512, WhirlpoolTree
+from utils.sha512_helpers import H_const, sha512_compress
+from utils.helpers import miller_rabin_prime, multiplicative_inverse, advanceMod, advanceMod_SM, advanceMod_window, FixedBaseModExp, MontgomeryContext
+from utils.ecc_helpers import EllipticCurveGFp
+
+def measure_rate(func, n_items: int) -> float:
+    """Run func once and return the number of items processed per second."""
+    start = time.perf_counter()
+    func()
+    return n_items / (time.perf_counter() - start)
+
+def benchmark_des_bitslice(n_blocks: int = 16384, n_scalar: int = 2000):
+    """Compare blocks/s of the bitsliced DES engine against the scalar integer engine."""
+    print("\n===== DES: bitsliced vs scalar =====")
+    des = DES()
+    key = random.getrandbits(64)
+    blocks = [random.getrandbits(64) for _ in range(n_blocks)]
+
+    scalar = measure_rate(lambda: [des.encrypt_int(block, key) for block in blocks[:n_scalar]], n_scalar)
+    many = measure_rate(lambda: des.encrypt_many(blocks, key), n_blocks)
+    many_keys = measure_rate(lambda: des.encrypt_many_keys(blocks[0], blocks), n_blocks)
+
+    print(f"Scalar encrypt_int:          {scalar:12,.0f} blocks/s")
+    print(f"Bitsliced encrypt_many:      {many:12,.0f} blocks/s ({many / scalar:.1f}x)")
+    print(f"Bitsliced encrypt_many_keys: {many_keys:12,.0f} keys/s ({many_keys / scalar:.1f}x)")
+
+def benchmark_aes_ttable(n_blocks: int = 2000, n_reference: int = 50):
+    """Compare blocks/s of the AES T-table backend against the reference round functions."""
+    print("\n===== AES: T-tables vs reference rounds =====")
+    for key_size in (16, 24, 32):
+        key, block = bytearray(os.urandom(key_size)), bytearray(os.urandom(16))
+        rates = {}
+        for backend, n in (('reference', n_reference), ('ttable', n_blocks)):
+            aes = AES(key_size, backend=backend)
+            expanded = aes.expand_key(key)
+            rates[backend] = measure_rate(lambda: [aes.encrypt_block(block, expanded) for _ in range(n)], n)
+        print(f"AES-{8 * key_size}: reference {rates['reference']:10,.0f} blocks/s, "
+              f"T-tables {rates['ttable']:10,.0f} blocks/s ({rates['ttable'] / rates['reference']:.1f}x)")
+
+def benchmark_aes_numpy(n_blocks: int = 100000, n_scalar: int = 2000):
+    """Blocks/s of the NumPy AES path (encrypt_blocks) against per-block T-table calls."""
+    print("\n===== AES-128: NumPy encrypt_blocks vs per-block =====")
+    aes = AES(16)
+    key = aes.set_key(bytearray(os.urandom(16)))
+    data = os.urandom(16 * n_blocks)
+    scalar = measure_rate(lambda: [aes.encrypt_block(data[i:i + 16], key) for i in range(0, 16 * n_scalar, 16)], n_scalar)
+    encrypt = measure_rate(lambda: aes.encrypt_blocks(data, key), n_blocks)
+    decrypt = measure_rate(lambda: aes.decrypt_blocks(data, key), n_blocks)
+    print(f"Per-block encrypt_block: {scalar:12,.0f} blocks/s")
+    print(f"NumPy encrypt_blocks:    {encrypt:12,.0f} blocks/s ({encrypt / scalar:.1f}x)")
+    print(f"NumPy decrypt_blocks:    {decrypt:12,.0f} blocks/s ({decrypt / scalar:.1f}x)")
+
+def benchmark_aes_512(n_blocks: int = 1000, n_reference: int = 50):
+    """Blocks/s of the 64-bit row-word engine for AES(key_size=64) against the step-by-step 8x8 rounds."""
+    print("\n===== AES 512-bit state: row words vs reference rounds =====")
+    key, block = bytearray(os.urandom(64)), bytearray(os.urandom(64))
+    rates = {}
+    for backend, n in (('reference', n_reference), ('ttable', n_blocks)):
+        aes = AES(64, backend=backend)
+        expanded = aes.expand_key(key)
+        rates[backend] = measure_rate(lambda: [aes.encrypt_block(block, expanded) for _ in range(n)], n)
+    print(f"Reference rounds: {rates['reference']:10,.0f} blocks/s")
+    print(f"Row-word tables:  {rates['ttable']:10,.0f} blocks/s ({rates['ttable'] / rates['reference']:.1f}x)")
+
+def benchmark_whirlpool(size: int = 1 << 17):
+    """MB/s of whirlpool_hash."""
+    print("\n===== Whirlpool hash =====")
+    data = os.urandom(size)
+    rate = measure_rate(lambda: whirlpool_hash(data), size) / 1e6
+    print(f"whirlpool_hash: {rate:8.3f} MB/s")
+
+def benchmark_sha512(size: int = 1 << 18, n_blocks: int = 300):
+    """MB/s of sha512_hash, and block rate of the unrolled compression against the step-by-step SHA_512 rounds."""
+    print("\n===== SHA-512 hash =====")
+    data = os.urandom(size)
+    rate = measure_rate(lambda: sha512_hash(data), size) / 1e6
+    print(f"sha512_hash: {rate:8.3f} MB/s")
+
+    block = [random.getrandbits(64) for _ in range(16)]
+    stepwise = SHA_512()
+    slow = measure_rate(lambda: [stepwise.sha512_encrypt(block) for _ in range(n_blocks)], n_blocks)
+    fast = measure_rate(lambda: [sha512_compress(H_const, block) for _ in range(n_blocks)], n_blocks)
+    print(f"SHA_512.sha512_encrypt: {slow:10,.0f} blocks/s")
+    print(f"sha512_compress:        {fast:10,.0f} blocks/s ({fast / slow:.1f}x)")
+
+def benchmark_sha512_many(n_messages: int = 20000, size: int = 32, n_single: int = 1000):
+    """Messages/s of sha512_many (NumPy lanes) against hashing one message at a time."""
+    print("\n===== SHA-512: many short messages =====")
+    messages = [os.urandom(size) for _ in range(n_messages)]
+    single = measure_rate(lambda: [sha512_hash(m) for m in messages[:n_single]], n_single)
+    many = measure_rate(lambda: sha512_many(messages), n_messages)
+    print(f"One at a time: {single:12,.0f} messages/s")
+    print(f"sha512_many:   {many:12,.0f} messages/s ({many / single:.1f}x)")
+
+def benchmark_pbkdf2(iterations: int = 2000):
+    """Iterations/s of pbkdf2_hmac_sha512 against a naive loop recomputing HMAC from the password each time."""
+    print("\n===== PBKDF2-HMAC-SHA512 =====")
+    password, salt = b"correct horse battery staple", os.urandom(16)
+
+    def naive():
+        U = T = hmac_sha512(password, salt + (1).to_bytes(4, 'big'))
+        for _ in range(iterations - 1):
+            U = hmac_sha512(password, U)
+            T = bytes(t ^ u for t, u in zip(T, U))
+        return T
+
+    slow = measure_rate(naive, iterations)
+    fast = measure_rate(lambda: pbkdf2_hmac_sha512(password, salt, iterations), iterations)
+    print(f"Naive HMAC per iteration: {slow:10,.0f} iterations/s")
+    print(f"pbkdf2_hmac_sha512:       {fast:10,.0f} iterations/s ({fast / slow:.1f}x)")
+
+def benchmark_parallel_ctr(size: int = 1 << 23, chunk_size: int = 1 << 20):
+    """MB/s of ParallelCTR (AES-128) for 1, 2, 4, ... workers up to the number of CPUs."""
+    print("\n===== ParallelCTR (AES-128) scaling =====")
+    data = os.urandom(size)
+    key, iv = os.urandom(16), os.urandom(16)
+    cpus = os.cpu_count() or 1
+    workers, baseline = 1, None
+    while True:
+        with ParallelCTR(AES(16), key, iv, workers=workers, chunk_size=chunk_size) as ctr:
+            rate = measure_rate(lambda: ctr.encrypt(data), size) / 1e6
+        baseline = baseline or rate
+        print(f"{workers:3d} worker(s): {rate:8.3f} MB/s ({rate / baseline:.2f}x)")
+        if workers >= cpus:
+            break
+        workers = min(2 * workers, cpus)
+
+def benchmark_whirlpool_tree(size: int = 1 << 20, leaf_size: int = 1 << 16):
+    """MB/s of the Whirlpool tree hash for 1, 2, 4, ... workers, and of rehashing one changed leaf."""
+    print("\n===== Whirlpool tree hash =====")
+    data = bytearray(os.urandom(size))
+    cpus = os.cpu_count() or 1
+    workers = 1
+    while True:
+        rate = measure_rate(lambda: WhirlpoolTree.build(data, leaf_size, workers), size) / 1e6
+        print(f"{workers:3d} worker(s): {rate:8.3f} MB/s")
+        if workers >= cpus:
+            break
+        workers = min(2 * workers, cpus)
+
+    tree = WhirlpoolTree.build(data, leaf_size)
+    data[size // 2] ^= 1
+    full = measure_rate(lambda: WhirlpoolTree.build(data, leaf_size), 1)
+    incremental = measure_rate(lambda: tree.rehash(data, [size // 2 // leaf_size]), 1)
+    print(f"Full rebuild:    {full:10,.1f} trees/s")
+    print(f"One-leaf rehash: {incremental:10,.1f} trees/s ({incremental / full:.1f}x)")
+
+def benchmark_rsa_crt(bit_size: int = 1024, n_messages: int = 20):
+    """Decryptions/s with the CRT private key against the plain (d, n) key, for a 2 * bit_size-bit modulus."""
+    print(f"\n===== RSA-{2 * bit_size} decryption: CRT vs plain =====")
+    e, d = 65537, None
+    while d is None:
+        p, q = miller_rabin_prime(bit_size), miller_rabin_prime(bit_size)
+        d = multiplicative_inverse(e, (p - 1) * (q - 1)) if p != q else None
+    n = p * q
+    ciphertexts = [random.randrange(n) for _ in range(n_messages)]
+    rsa = RSA()
+    plain = measure_rate(lambda: rsa.decrypt(ciphertexts, (d, n)), n_messages)
+    crt = measure_rate(lambda: rsa.decrypt(ciphertexts, RSAPrivateKey(d, n, p, q)), n_messages)
+    print(f"Plain (d, n): {plain:10,.1f} decryptions/s")
+    print(f"CRT:          {crt:10,.1f} decryptions/s ({crt / plain:.1f}x)")
+
+def benchmark_rsa_keygen(modulus_bits: int = 2048, n_keys: int = 5):
+    """Seconds per key pair of RSA.generate_key_pair, in this process and with p and q in parallel."""
+    print(f"\n===== RSA-{modulus_bits} key generation =====")
+    rsa = RSA()
+    for workers in (1, 2):
+        rate = measure_rate(lambda: [rsa.generate_key_pair(modulus_bits, workers=workers) for _ in range(n_keys)], n_keys)
+        print(f"{workers} worker(s): {1 / rate:6.2f} s/key")
+
+def benchmark_modexp(bits: int = 2048, n_exponents: int = 10):
+    """Exponentiations/s with a full-size exponent: bit-at-a-time loops, sliding window, fixed-base cache and pow."""
+    print(f"\n===== {bits}-bit modular exponentiation =====")
+    c = random.getrandbits(bits) | (1 << (bits - 1)) | 1
+    a = random.randrange(c)
+    exponents = [random.getrandbits(bits) for _ in range(n_exponents)]
+    fixed = FixedBaseModExp(a, c)
+    engines = {
+        'advanceMod': lambda b: advanceMod(a, b, c),
+        'advanceMod_SM': lambda b: advanceMod_SM(a, b, c),
+        'advanceMod_window': lambda b: advanceMod_window(a, b, c),
+        'FixedBaseModExp': fixed.pow,
+        'pow': lambda b: pow(a, b, c),
+    }
+    baseline = None
+    for name, engine in engines.items():
+        rate = measure_rate(lambda: [engine(b) for b in exponents], n_exponents)
+        baseline = baseline or rate
+        print(f"{name:18s} {rate:10,.1f} exps/s ({rate / baseline:.2f}x)")
+
+def benchmark_montgomery(n_scalars: int = 5):
+    """Montgomery arithmetic against plain %: exponentiation by modulus size, and secp256k1 scalar multiplication."""
+    print("\n===== Montgomery context =====")
+    for bits in (256, 1024, 2048, 4096):
+        c = random.getrandbits(bits) | (1 << (bits - 1)) | 1
+        a, context = random.randrange(c), MontgomeryContext(c)
+        exponents = [random.getrandbits(bits) for _ in range(max(3, 8192 // bits))]
+        window = measure_rate(lambda: [advanceMod_window(a, b, c) for b in exponents], len(exponents))
+        mont = measure_rate(lambda: [context.pow(a, b) for b in exponents], len(exponents))
+        ladder = measure_rate(lambda: [context.ladder(a, b) for b in exponents], len(exponents))
+        print(f"{bits:5d}-bit: advanceMod_window {window:9,.1f}/s, Montgomery window {mont:9,.1f}/s ({mont / window:.2f}x), ladder {ladder:9,.1f}/s")
+
+    p = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+    G = (0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+         0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8)
+    scalars = [random.getrandbits(256) for _ in range(n_scalars)]
+    for montgomery in (False, True):
+        curve = EllipticCurveGFp(0, 7, p, montgomery)
+        rate = measure_rate(lambda: [curve.multiply_point(G, k) for k in scalars], n_scalars)
+        print(f"secp256k1 multiply_point (montgomery={montgomery}): {rate:8,.1f}/s")
+
+def benchmark_rsa_bytes(size: int = 1 << 16, modulus_bits: int = 2048, n_letters: int = 2000):
+    """Bytes/s of RSA.encrypt_bytes/decrypt_bytes against one exponentiation per letter, as in the text API."""
+    print(f"\n===== RSA-{modulus_bits} bytes API =====")
+    rsa = RSA()
+    public_key, private_key = rsa.generate_key_pair(modulus_bits)
+    e, n = public_key
+    letters = [random.randrange(26) for _ in range(n_letters)]
+    data = os.urandom(size)
+    per_letter = measure_rate(lambda: [advanceMod_window(m, e, n) for m in letters], n_letters)
+    ciphertext = rsa.encrypt_bytes(data, public_key)
+    encrypt = measure_rate(lambda: rsa.encrypt_bytes(data, public_key), size)
+    decrypt = measure_rate(lambda: rsa.decrypt_bytes(ciphertext, private_key), size)
+    print(f"One exponentiation per letter: {per_letter:12,.0f} bytes/s")
+    print(f"encrypt_bytes:                 {encrypt:12,.0f} bytes/s ({encrypt / per_letter:.0f}x)")
+    print(f"decrypt_bytes (CRT):           {decrypt:12,.0f} bytes/s")
+
+BENCHMARKS = {
+    'des_bitslice': benchmark_des_bitslice,
+    'aes_ttable': benchmark_aes_ttable,
+    'aes_numpy': benchmark_aes_numpy,
+    'aes_512': benchmark_aes_512,
+    'whirlpool': benchmark_whirlpool,
+    'whirlpool_tree': benchmark_whirlpool_tree,
+    'sha512': benchmark_sha512,
+    'sha512_many': benchmark_sha512_many,
+    'pbkdf2': benchmark_pbkdf2,
+    'modexp': benchmark_modexp,
+    'montgomery': benchmark_montgomery,
+    'rsa_crt': benchmark_rsa_crt,
+    'rsa_keygen': benchmark_rsa_keygen,
+    'rsa_bytes': benchmark_rsa_bytes,
+    'parallel_ctr': benchmark_parallel_ctr,
+}
+
+if __name__ == "__main__":
+    # Usage (from src): python -m examples.benchmark [name ...]
+    for name in sys.argv[1:] or list(BENCHMARKS):
+        BENCHMARKS[name]()
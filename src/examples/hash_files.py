@@ -0,0 +1,25 @@
+import argparse
+import sys
+
+from algorithms.hash_file import HASH_ALGORITHMS, hash_files
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Hash files with the project's Whirlpool or SHA-512.")
+    parser.add_argument('files', nargs='+', help="files to hash")
+    parser.add_argument('-a', '--algorithm', choices=sorted(HASH_ALGORITHMS), default='whirlpool')
+    parser.add_argument('-j', '--workers', type=int, default=1, help="processes to hash files in parallel")
+    args = parser.parse_args(argv)
+
+    status = 0
+    for result in hash_files(args.files, args.algorithm, args.workers):
+        if result['error'] is not None:
+            print(f"{parser.prog}: error: {result['path']}: {result['error']}", file=sys.stderr)
+            status = 1
+            continue
+        rate = result['size'] / result['seconds'] / 1e6 if result['seconds'] > 0 else float('inf')
+        print(f"{result['digest']}  {result['path']}  ({result['size']:,} bytes, {rate:.3f} MB/s)")
+    return status
+
+if __name__ == "__main__":
+    # Usage (from src): python -m examples.hash_files [-a whirlpool|sha512] [-j N] file [file ...]
+    sys.exit(main())
@@ -1 +1,8 @@
-from .test_ecc import ECCTester
\ No newline at end of file
+from .test_ecc import ECCTester
+from .test_des import DESTester
+from .test_modes import ModesTester
+from .test_aes import AESTester
+from .test_whirlpool import WhirlpoolTester
+from .test_sha512 import SHA512Tester
+from .test_hmac_sha512 import HMACSHA512Tester
+from .test_rsa import RSATester
\ No newline at end of file
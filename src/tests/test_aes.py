@@ -0,0 +1,86 @@
+import os
+
+import numpy as np
+
+from algorithms.aes import AES
+from utils.aes_general_funcs import galois_multiplication_GF8, gf8_mul_table
+
+# Testing Class
+class AESTester:
+    def __init__(self):
+        # FIPS-197 Appendix C vectors
+        self.plaintext = bytes.fromhex("00112233445566778899aabbccddeeff")
+        self.vectors = {
+            16: ("000102030405060708090a0b0c0d0e0f", "69c4e0d86a7b0430d8cdb78070b4c55a"),
+            24: ("000102030405060708090a0b0c0d0e0f1011121314151617", "dda97ca4864cdfe06eaf70a0ec0d7191"),
+            32: ("000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f", "8ea2b7ca516745bfeafc49904b496089"),
+        }
+
+    def test_known_answer(self):
+        print("\n===== Testing AES against FIPS-197 =====")
+        for backend in AES.backends:
+            for key_size, (key, expected) in self.vectors.items():
+                aes = AES(key_size, backend=backend)
+                ciphertext = aes.encrypt(bytearray(self.plaintext), bytearray.fromhex(key))
+                print(f"AES-{8 * key_size} ({backend}): encryption matches: {ciphertext.hex() == expected}, "
+                      f"decryption matches: {aes.decrypt(ciphertext, bytearray.fromhex(key)) == self.plaintext}")
+
+    def test_ttable_against_reference(self, n_blocks: int = 100):
+        print("\n===== Testing T-table backend against reference rounds =====")
+        for key_size in self.vectors:
+            ttable, reference = AES(key_size, backend='ttable'), AES(key_size, backend='reference')
+            key = bytearray(os.urandom(key_size))
+            expanded, expanded_ref = ttable.expand_key(key), reference.expand_key(key)
+            blocks = [bytearray(os.urandom(16)) for _ in range(n_blocks)]
+            encrypt_ok = all(ttable.encrypt_block(b, expanded) == reference.encrypt_block(b, expanded_ref) for b in blocks)
+            decrypt_ok = all(ttable.decrypt_block(b, expanded) == reference.decrypt_block(b, expanded_ref) for b in blocks)
+            print(f"AES-{8 * key_size}: encryption matches: {encrypt_ok}, decryption matches: {decrypt_ok}")
+
+    def test_prepared_key(self):
+        print("\n===== Testing PreparedAESKey / set_key =====")
+        for backend in AES.backends:
+            aes = AES(16, backend=backend)
+            key, block = bytearray(os.urandom(16)), bytearray(os.urandom(16))
+            expected = aes.encrypt(block, key)
+            prepared = aes.expand_key(key)
+            aes.set_key(key)
+            print(f"{backend}: prepared key matches: {aes.encrypt_block(block, prepared) == expected}, "
+                  f"set_key matches: {aes.encrypt_block(block) == expected}, "
+                  f"round trip: {aes.decrypt_block(aes.encrypt_block(block)) == block}")
+
+    def test_encrypt_blocks(self, n_blocks: int = 200):
+        print("\n===== Testing NumPy encrypt_blocks/decrypt_blocks =====")
+        for key_size in self.vectors:
+            aes = AES(key_size)
+            key = bytearray(os.urandom(key_size))
+            blocks = np.frombuffer(os.urandom(16 * n_blocks), dtype=np.uint8).reshape(-1, 16)
+            encrypted = aes.encrypt_blocks(blocks, key)
+            matches = all(bytes(aes.encrypt(bytearray(blocks[i].tobytes()), key)) == encrypted[i].tobytes() for i in range(n_blocks))
+            round_trip = aes.decrypt_blocks(encrypted.tobytes(), key) == blocks.tobytes()
+            print(f"AES-{8 * key_size}: matches per-block encrypt: {matches}, round trip: {round_trip}")
+
+    def test_512_state(self, n_blocks: int = 20):
+        print("\n===== Testing 512-bit state variant (key_size=64) =====")
+        rows, reference = AES(64, backend='ttable'), AES(64, backend='reference')
+        key = bytearray(os.urandom(64))
+        blocks = [bytearray(os.urandom(64)) for _ in range(n_blocks)]
+        matches = all(rows.encrypt(block, key) == reference.encrypt(block, key) for block in blocks)
+        print(f"Row-word engine matches step-by-step rounds: {matches}")
+
+    def test_gf_tables(self):
+        print("\n===== Testing GF(2^8) product tables =====")
+        for modulus in (0x11B, 0x11D):
+            table = gf8_mul_table(modulus)
+            matches = all(table[a][b] == galois_multiplication_GF8(a, b, modulus) for a in range(256) for b in range(256))
+            print(f"Modulus {modulus:#x}: table matches bit-loop multiplication: {matches}")
+
+    def run_all_tests(self):
+        print("======================================")
+        print("AES Tests")
+        print("======================================")
+        self.test_known_answer()
+        self.test_ttable_against_reference()
+        self.test_prepared_key()
+        self.test_encrypt_blocks()
+        self.test_512_state()
+        self.test_gf_tables()
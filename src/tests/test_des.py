@@ -0,0 +1,102 @@
+import random
+
+from algorithms.des import DES
+from utils.des_helpers import *
+from utils.helpers import *
+
+# Testing Class
+class DESTester:
+    def __init__(self):
+        self.des = DES()
+        self.plaintext = "123456ABCD132536"
+        self.key = "AABB09182736CCDD"
+        self.expected = "C0B7A8D05F3A829C"
+
+    @staticmethod
+    def bit_string_des(plaintext: str, key: str, decrypt: bool = False) -> str:
+        """Reference DES built only from the bit-string helpers."""
+        left, right = split_half(des_permute(plaintext, des_initial_permutation, 64))
+        keys = des_key_generation(key)
+        if decrypt:
+            keys.reverse()
+        for round in range(16):
+            left, right = des_mixer(left, right, keys[round])
+            if round != 15:
+                left, right = swap_half(left, right)
+        return des_permute(des_combine(left, right), des_final_permutation, 64)
+
+    def test_known_answer(self):
+        print("\n===== Testing DES Known Answer =====")
+        ciphertext = self.des.encrypt(hex2bin(self.plaintext), hex2bin(self.key))
+        print(f"Ciphertext: {bin2hex(ciphertext)}, expected: {self.expected}")
+        print(f"Encryption successful: {bin2hex(ciphertext) == self.expected}")
+        decrypted = self.des.decrypt(ciphertext, hex2bin(self.key))
+        print(f"Decryption successful: {bin2hex(decrypted) == self.plaintext}")
+
+    def test_int_and_bytes_api(self):
+        print("\n===== Testing DES int/bytes API =====")
+        ciphertext = self.des.encrypt_int(hex2dec(self.plaintext), hex2dec(self.key))
+        print(f"encrypt_int matches: {ciphertext == hex2dec(self.expected)}")
+        print(f"decrypt_int matches: {self.des.decrypt_int(ciphertext, hex2dec(self.key)) == hex2dec(self.plaintext)}")
+        block = self.des.encrypt_bytes(bytes.fromhex(self.plaintext), bytes.fromhex(self.key))
+        print(f"encrypt_bytes matches: {block.hex().upper() == self.expected}")
+        print(f"decrypt_bytes matches: {self.des.decrypt_bytes(block, bytes.fromhex(self.key)).hex().upper() == self.plaintext}")
+
+    def test_against_bit_strings(self, n_blocks: int = 100):
+        print("\n===== Testing DES against the bit-string helpers =====")
+        mismatches = 0
+        for _ in range(n_blocks):
+            plaintext = dec2bin(random.getrandbits(64), 64)
+            key = dec2bin(random.getrandbits(64), 64)
+            ciphertext = self.des.encrypt(plaintext, key)
+            if ciphertext != self.bit_string_des(plaintext, key):
+                mismatches += 1
+            if self.des.decrypt(ciphertext, key) != self.bit_string_des(ciphertext, key, decrypt=True):
+                mismatches += 1
+        print(f"Random blocks checked: {n_blocks}, mismatches: {mismatches}")
+
+    def test_sp_tables(self, n_inputs: int = 100):
+        print("\n===== Testing DES SP tables =====")
+        mismatches = 0
+        for _ in range(n_inputs):
+            right, round_key = random.getrandbits(32), random.getrandbits(48)
+            expected = des_function(dec2bin(right, 32), dec2bin(round_key, 48))
+            if dec2bin(des_function_int(right, round_key), 32) != expected:
+                mismatches += 1
+        print(f"Random rounds checked: {n_inputs}, mismatches: {mismatches}")
+
+    def test_key_schedule_cache(self):
+        print("\n===== Testing DES key schedule cache =====")
+        cache = DESKeyScheduleCache(maxsize=2)
+        des = DES(key_cache=cache)
+        key = hex2dec(self.key)
+        ciphertext = des.encrypt_int(hex2dec(self.plaintext), key)
+        des.decrypt_int(ciphertext, key)
+        print(f"After encrypt + decrypt with one key: {cache.info()}")
+        print(f"Reversed schedule stored: {cache.decryption_keys(key) == tuple(reversed(des_key_generation_int(key)))}")
+        for other_key in (1, 2, 3):
+            des.encrypt_int(0, other_key)
+        print(f"After 3 more keys: {cache.info()}")
+        print(f"Least recently used key evicted: {len(cache) == 2}")
+
+    def test_bitsliced(self, n_blocks: int = 200):
+        print("\n===== Testing bitsliced DES =====")
+        key = random.getrandbits(64)
+        blocks = [random.getrandbits(64) for _ in range(n_blocks)]
+        ciphertexts = self.des.encrypt_many(blocks, key, lanes=64)
+        print(f"encrypt_many matches scalar: {ciphertexts == [self.des.encrypt_int(block, key) for block in blocks]}")
+        print(f"decrypt_many round trip: {self.des.decrypt_many(ciphertexts, key) == blocks}")
+        keys = blocks
+        ciphertexts = self.des.encrypt_many_keys(hex2dec(self.plaintext), keys, lanes=64)
+        print(f"encrypt_many_keys matches scalar: {ciphertexts == [self.des.encrypt_int(hex2dec(self.plaintext), k) for k in keys]}")
+
+    def run_all_tests(self):
+        print("======================================")
+        print("DES Tests")
+        print("======================================")
+        self.test_known_answer()
+        self.test_int_and_bytes_api()
+        self.test_sp_tables()
+        self.test_against_bit_strings()
+        self.test_key_schedule_cache()
+        self.test_bitsliced()
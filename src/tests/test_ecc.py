@@ -1,6 +1,7 @@
 import hashlib
 import sys
 import os
+import random
 
 from algorithms.ecc import ECC_GFp, ECC_GF2n
 from utils.ecc_helpers import EllipticCurveGFp, EllipticCurveGF2n
@@ -191,6 +192,21 @@ class ECCTester:
         print(f"Bob's derived key (truncated): {bob_key[:10]}...")
         print(f"Derived keys match: {alice_key == bob_key}")
     
+    def test_montgomery_multiply(self, n_scalars: int = 5):
+        print("\n===== Testing Montgomery/Jacobian scalar multiplication =====")
+        p = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+        G = (0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+             0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8)
+        n = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+        affine, jacobian = EllipticCurveGFp(0, 7, p), EllipticCurveGFp(0, 7, p, montgomery=True)
+        scalars = [random.randrange(1, n) for _ in range(n_scalars)] + [1, 2, n - 1, n]
+        print(f"secp256k1 matches affine: {all(affine.multiply_point(G, k) == jacobian.multiply_point(G, k) for k in scalars)}")
+
+        # a != 0 and multiples running through the point at infinity
+        affine, jacobian = EllipticCurveGFp(2, 3, 97), EllipticCurveGFp(2, 3, 97, montgomery=True)
+        P = (3, 6)
+        print(f"Small curve matches affine: {all(affine.multiply_point(P, k) == jacobian.multiply_point(P, k) for k in range(1, 30))}")
+
     def test_curve25519(self):
         print("\n===== Curve25519 Parameters =====")
         p = 2**255 - 19
@@ -230,5 +246,6 @@ class ECCTester:
         self.test_gfp()
         self.test_gf2n()
         self.test_secp256k1()
+        self.test_montgomery_multiply()
         self.test_curve25519()
         self.test_binary_curve()
\ No newline at end of file
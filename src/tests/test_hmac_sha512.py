@@ -0,0 +1,33 @@
+import hashlib
+import hmac
+import os
+
+from algorithms.hmac_sha512 import HMAC_SHA512, hmac_sha512, pbkdf2_hmac_sha512
+
+# Testing Class
+class HMACSHA512Tester:
+    def test_hmac(self):
+        print("\n===== Testing HMAC-SHA512 against the standard library =====")
+        for key_size in (0, 20, 128, 200):
+            key, message = os.urandom(key_size), os.urandom(300)
+            expected = hmac.new(key, message, 'sha512').digest()
+            mac = HMAC_SHA512(key)
+            mac.update(message[:100])
+            mac.update(message[100:])
+            print(f"{key_size}-byte key: one-shot matches: {hmac_sha512(key, message) == expected}, "
+                  f"streaming matches: {mac.digest() == expected}, "
+                  f"new() reuses the key: {mac.new(b'other').digest() == hmac.new(key, b'other', 'sha512').digest()}")
+
+    def test_pbkdf2(self):
+        print("\n===== Testing PBKDF2-HMAC-SHA512 against hashlib =====")
+        for password, salt, iterations, dklen in ((b"password", b"salt", 1, 64), (b"password", b"salt", 1000, 64),
+                                                  (b"passwordPASSWORD", b"saltSALTsalt", 10, 100)):
+            expected = hashlib.pbkdf2_hmac('sha512', password, salt, iterations, dklen)
+            print(f"{iterations} iterations, {dklen} bytes: matches: {pbkdf2_hmac_sha512(password, salt, iterations, dklen) == expected}")
+
+    def run_all_tests(self):
+        print("======================================")
+        print("HMAC-SHA512 Tests")
+        print("======================================")
+        self.test_hmac()
+        self.test_pbkdf2()
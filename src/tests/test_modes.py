@@ -0,0 +1,94 @@
+import os
+
+from algorithms.aes import AES
+from algorithms.des import DES
+from algorithms.tripledes import TripleDES
+from algorithms.modes import ECB, CBC, CTR, OFB, CFB, ParallelCTR
+
+# Testing Class
+class ModesTester:
+    def __init__(self):
+        # NIST SP 800-38A, AES-128 vectors
+        self.key = bytes.fromhex("2b7e151628aed2a6abf7158809cf4f3c")
+        self.iv = bytes.fromhex("000102030405060708090a0b0c0d0e0f")
+        self.counter = bytes.fromhex("f0f1f2f3f4f5f6f7f8f9fafbfcfdfeff")
+        self.plaintext = bytes.fromhex(
+            "6bc1bee22e409f96e93d7e117393172aae2d8a571e03ac9c9eb76fac45af8e51"
+            "30c81c46a35ce411e5fbc1191a0a52eff69f2445df4f9b17ad2b417be66c3710")
+        self.expected = {
+            'ECB': "3ad77bb40d7a3660a89ecaf32466ef97f5d3d58503b9699de785895a96fdbaaf"
+                   "43b1cd7f598ece23881b00e3ed0306887b0c785e27e8ad3f8223207104725dd4",
+            'CBC': "7649abac8119b246cee98e9b12e9197d5086cb9b507219ee95db113a917678b2"
+                   "73bed6b8e3c1743b7116e69e222295163ff1caa1681fac09120eca307586e1a7",
+            'CTR': "874d6191b620e3261bef6864990db6ce9806f66b7970fdff8617187bb9fffdff"
+                   "5ae4df3edbd5d35e5b4f09020db03eab1e031dda2fbe03d1792170a0f3009cee",
+            'OFB': "3b3fd92eb72dad20333449f8e83cfb4a7789508d16918f03f53c52dac54ed825"
+                   "9740051e9c5fecf64344f7a82260edcc304c6528f659c77866a510d9c1d6ae5e",
+            'CFB': "3b3fd92eb72dad20333449f8e83cfb4ac8a64537a0b3a93fcde3cdad9f1ce58b"
+                   "26751f67a3cbb140b1808cf187a4f4dfc04b05357c5d1c0eeac4c66f9ff7f2e6",
+        }
+
+    def test_nist_vectors(self):
+        print("\n===== Testing AES modes against NIST SP 800-38A =====")
+        aes = AES(16)
+        modes = {
+            'ECB': ECB(aes, self.key, padding=False),
+            'CBC': CBC(aes, self.key, self.iv, padding=False),
+            'CTR': CTR(aes, self.key, self.counter),
+            'OFB': OFB(aes, self.key, self.iv),
+            'CFB': CFB(aes, self.key, self.iv),
+        }
+        for name, mode in modes.items():
+            ciphertext = mode.encrypt(self.plaintext)
+            print(f"{name}: encryption matches: {ciphertext.hex() == self.expected[name]}, "
+                  f"decryption matches: {mode.decrypt(ciphertext) == self.plaintext}")
+
+    def test_streaming(self):
+        print("\n===== Testing streaming update/finalize =====")
+        message = os.urandom(1000)
+        for algo, key in ((DES(), os.urandom(8)), (TripleDES(), os.urandom(24)), (AES(16), os.urandom(16))):
+            for mode in (ECB(algo, key), CBC(algo, key, os.urandom(algo.block_size)),
+                         CTR(algo, key, os.urandom(algo.block_size))):
+                encryptor = mode.encryptor()
+                ciphertext = b''.join(encryptor.update(message[i:i + 37]) for i in range(0, len(message), 37))
+                ciphertext += encryptor.finalize()
+                decryptor = mode.decryptor()
+                decrypted = b''.join(decryptor.update(ciphertext[i:i + 13]) for i in range(0, len(ciphertext), 13))
+                decrypted += decryptor.finalize()
+                print(f"{type(algo).__name__}-{type(mode).__name__}: one-shot matches: {ciphertext == mode.encrypt(message)}, "
+                      f"round trip: {decrypted == message}")
+
+    def test_parallel_ctr(self):
+        print("\n===== Testing ParallelCTR =====")
+        message = os.urandom(5000)
+        for algo, key in ((DES(), os.urandom(8)), (AES(16), os.urandom(16))):
+            iv = os.urandom(algo.block_size)
+            with ParallelCTR(algo, key, iv, workers=2, chunk_size=512) as ctr:
+                ciphertext = ctr.encrypt(message)
+                decrypted = ctr.decrypt(ciphertext)
+            print(f"{type(algo).__name__}: matches CTR: {ciphertext == CTR(algo, key, iv).encrypt(message)}, "
+                  f"round trip: {decrypted == message}")
+
+    @staticmethod
+    def rejects(make) -> bool:
+        try:
+            make()
+        except ValueError:
+            return True
+        return False
+
+    def test_key_validation(self):
+        print("\n===== Testing key validation =====")
+        for key in (b'abc', bytes(9), 'abcdefgh', -1, 1 << 64):
+            print(f"DES key {key!r}: rejected: {self.rejects(lambda: ECB(DES(), key))}")
+        for key in ((b'a', b'b'), (bytes(8), bytes(8), 1 << 64), (bytes(8),), bytes(8) * 4):
+            print(f"TripleDES key {key!r}: rejected: {self.rejects(lambda: ECB(TripleDES(), key))}")
+
+    def run_all_tests(self):
+        print("======================================")
+        print("Block Cipher Modes Tests")
+        print("======================================")
+        self.test_nist_vectors()
+        self.test_streaming()
+        self.test_parallel_ctr()
+        self.test_key_validation()
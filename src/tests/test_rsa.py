@@ -0,0 +1,96 @@
+import os
+import pickle
+import random
+
+from algorithms.rsa import RSA, RSAPrivateKey
+from utils.helpers import miller_rabin_prime, multiplicative_inverse, is_probable_prime, is_prime, advanceMod_window, FixedBaseModExp, MontgomeryContext
+
+# Testing Class
+class RSATester:
+    def __init__(self, bit_size: int = 256):
+        self.rsa = RSA()
+        p = miller_rabin_prime(bit_size)
+        q = miller_rabin_prime(bit_size)
+        while q == p:
+            q = miller_rabin_prime(bit_size)
+        self.p, self.q = p, q
+        self.e = 65537
+        self.d = multiplicative_inverse(self.e, (p - 1) * (q - 1))
+        while self.d is None:
+            self.e += 2
+            self.d = multiplicative_inverse(self.e, (p - 1) * (q - 1))
+
+    def test_window_modexp(self, n_cases: int = 200):
+        print("\n===== Testing sliding-window modexp against pow =====")
+        matches = True
+        for _ in range(n_cases):
+            c = random.getrandbits(random.randint(2, 600)) | 1
+            a, b = random.getrandbits(600), random.getrandbits(random.randint(0, 800))
+            matches &= advanceMod_window(a, b, c) == pow(a, b, c)
+        print(f"advanceMod_window matches: {matches}")
+        n = self.p * self.q
+        fixed = FixedBaseModExp(3, n)
+        context = MontgomeryContext(n)
+        x, y = random.randrange(n), random.randrange(n)
+        print(f"Montgomery mont_mul/mont_sqr match: {context.from_mont(context.mont_mul(context.to_mont(x), context.to_mont(y))) == x * y % n and context.from_mont(context.mont_sqr(context.to_mont(x))) == x * x % n}")
+        print(f"Montgomery pow and ladder match: {context.pow(x, self.d) == context.ladder(x, self.d) == pow(x, self.d, n)}")
+        print(f"FixedBaseModExp matches: {all(fixed.pow(b) == pow(3, b, n) for b in (0, 1, self.e, self.d))}")
+
+    def test_crt_decrypt(self, n_messages: int = 20):
+        print("\n===== Testing CRT decryption against the plain (d, n) key =====")
+        n = self.p * self.q
+        crt_key = RSAPrivateKey(self.d, n, self.p, self.q)
+        messages = [random.randrange(n) for _ in range(n_messages)]
+        ciphertexts = [pow(m, self.e, n) for m in messages]
+        print(f"Unpacks as (d, n): {tuple(crt_key) == (self.d, n)}")
+        print(f"CRT decrypt matches: {self.rsa.decrypt(ciphertexts, crt_key) == messages}")
+        print(f"Plain decrypt matches: {self.rsa.decrypt(ciphertexts, (self.d, n)) == messages}")
+        print(f"Survives pickling: {pickle.loads(pickle.dumps(crt_key)).qInv == crt_key.qInv}")
+
+        small_public, small_private = self.rsa.generate_keys(61, 53)
+        ciphertext = self.rsa.encrypt("hello", small_public)
+        print(f"generate_keys keeps p and q: {small_private.has_crt and self.rsa.decrypt(ciphertext, small_private, text=True) == 'hello'}")
+
+    def test_sign(self, n_messages: int = 5):
+        print("\n===== Testing sign/verify =====")
+        n = self.p * self.q
+        public_key = (self.e, n)
+        crt_key = RSAPrivateKey(self.d, n, self.p, self.q)
+        messages = [random.randrange(n) for _ in range(n_messages)]
+        signatures = self.rsa.sign(messages, crt_key)
+        print(f"CRT signatures match plain ones: {signatures == self.rsa.sign(messages, (self.d, n))}")
+        print(f"Signatures verify: {self.rsa.verify(messages, signatures, public_key)}")
+        print(f"Tampered message fails: {not self.rsa.verify(messages[0] + 1, signatures[0], public_key)}")
+
+    def test_key_generation(self, modulus_bits: int = 1024):
+        print("\n===== Testing key generation =====")
+        print(f"is_probable_prime matches is_prime below 20000: {all(is_probable_prime(n) == is_prime(n) for n in range(20000))}")
+        public_key, private_key = self.rsa.generate_key_pair(modulus_bits)
+        e, n = public_key
+        print(f"Modulus has {modulus_bits} bits: {n.bit_length() == modulus_bits}")
+        print(f"e = 65537: {e == 65537}")
+        print(f"Round trip: {self.rsa.decrypt([pow(12345, e, n)], private_key) == [12345]}")
+
+    def test_bytes_api(self):
+        print("\n===== Testing bytes-in/bytes-out RSA =====")
+        n = self.p * self.q
+        public_key, crt_key = (self.e, n), RSAPrivateKey(self.d, n, self.p, self.q)
+        k = (n.bit_length() + 7) // 8
+        for size in (0, 1, k - 11, k - 10, 1000):
+            data = os.urandom(size)
+            ciphertext = self.rsa.encrypt_bytes(data, public_key)
+            print(f"{size} bytes: {len(ciphertext) // k} block(s), round trip: {self.rsa.decrypt_bytes(ciphertext, crt_key) == data and self.rsa.decrypt_bytes(ciphertext, (self.d, n)) == data}")
+        data = os.urandom(5000)
+        ciphertext = self.rsa.encrypt_bytes(data, public_key, workers=2)
+        print(f"Process pool round trip: {self.rsa.decrypt_bytes(ciphertext, crt_key, workers=2) == data}")
+        print(f"Padding is randomized: {self.rsa.encrypt_bytes(b'abc', public_key) != self.rsa.encrypt_bytes(b'abc', public_key)}")
+
+    def run_all_tests(self):
+        print("======================================")
+        print("RSA Tests")
+        print("======================================")
+        self.test_window_modexp()
+        self.test_crt_decrypt()
+        self.test_sign()
+        self.test_key_generation()
+        self.test_bytes_api()
@@ -0,0 +1,55 @@
+import hashlib
+import os
+
+from algorithms.sha_512 import SHA_512, SHA512, sha512_hash, sha512_many
+
+# Testing Class
+class SHA512Tester:
+    def __init__(self):
+        # FIPS 180-4 "abc" test case, as a pre-padded block and as its digest words
+        self.TC1_block = [0x6162638000000000] + [0x0000000000000000] * 14 + [0x0000000000000018]
+        self.TC1_expected = [0xDDAF35A193617ABA, 0xCC417349AE204131, 0x12E6FA4E89A97EA2, 0x0A9EEEE64B55D39A,
+                             0x2192992A274FC1A8, 0x36BA3C23A3FEEBBD, 0x454D4423643CE80E, 0x2A9AC94FA54CA49F]
+
+    def test_block_api(self):
+        print("\n===== Testing SHA_512 block API (TC1) =====")
+        for attempt in range(2):
+            sha512 = SHA_512()
+            sha512.sha512_encrypt(self.TC1_block)
+            # A second instance must start from the initial digest again
+            print(f"Instance {attempt + 1}: matches: {sha512.H == self.TC1_expected}")
+
+    def test_against_hashlib(self):
+        print("\n===== Testing SHA512 against hashlib =====")
+        for size in (0, 3, 111, 112, 128, 1000, 10000):
+            message = os.urandom(size)
+            print(f"{size} bytes: matches: {sha512_hash(message) == hashlib.sha512(message).digest()}")
+
+    def test_streaming(self):
+        print("\n===== Testing streaming SHA512 object =====")
+        message = os.urandom(1000)
+        for chunk in (1, 127, 128, 129, 300):
+            hasher = SHA512()
+            for i in range(0, len(message), chunk):
+                hasher.update(message[i:i + chunk])
+            print(f"Chunks of {chunk}: matches: {hasher.hexdigest() == hashlib.sha512(message).hexdigest()}")
+
+        prefix = SHA512(message[:200])
+        fork = prefix.copy()
+        prefix.update(b"first")
+        fork.update(b"second")
+        print(f"copy() forks the state: {prefix.digest() == hashlib.sha512(message[:200] + b'first').digest() and fork.digest() == hashlib.sha512(message[:200] + b'second').digest()}")
+
+    def test_many(self):
+        print("\n===== Testing sha512_many on NumPy lanes =====")
+        messages = [os.urandom(size) for size in (0, 3, 111, 112, 128, 200, 1000) for _ in range(5)]
+        print(f"{len(messages)} messages: matches hashlib: {sha512_many(messages) == [hashlib.sha512(m).digest() for m in messages]}")
+
+    def run_all_tests(self):
+        print("======================================")
+        print("SHA-512 Tests")
+        print("======================================")
+        self.test_block_api()
+        self.test_against_hashlib()
+        self.test_streaming()
+        self.test_many()
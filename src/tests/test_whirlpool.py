@@ -0,0 +1,119 @@
+import hashlib
+import os
+import tempfile
+
+from algorithms.whirlpool_cipher import WhirlpoolCipher
+from algorithms.whirlpool_hash import whirlpool_hash, Whirlpool
+from algorithms.hash_file import hash_file, hash_files
+from algorithms.whirlpool_tree import WhirlpoolTree, whirlpool_tree_hash
+from utils.aes_helpers import AES_Helpers
+from utils.aes_general_funcs import aes_64_Rcon
+
+# Testing Class
+class WhirlpoolTester:
+    def __init__(self):
+        # Digests of this repo's Whirlpool-style construction (aes_64_sbox, MIX_ROWS_MATRIX,
+        # aes_64_Rcon), which is not the ISO Whirlpool, so the reference values are its own
+        self.expected = {
+            b"": "9c098f039c3d374127bed1d6f98c64995fbdad378b4cace62bc07701c48fed6c"
+                 "119d049fbb2216f42a7b4ce6db94c1b46dc3f6bc21e9059c7086ecef699238bc",
+            b"abc": "b63840cc4e88e219cd69a94d873b591deaf31387b504dc1b1b6ba2e84669e835"
+                    "6b3c1c6b8cb54719f5c07c5a0c522130b13a4fdf3ea6826eb4238d52e7a5f465",
+        }
+
+    @staticmethod
+    def step_by_step_encrypt(plaintext: bytearray, key: bytearray) -> bytearray:
+        """Reference cipher on the byte state: sub_bytes, shift_cols, mix_rows, add_round_key."""
+        helpers = AES_Helpers(64)
+        round_keys = [bytearray(key)]
+        for round in range(1, 11):
+            k = helpers.mix_rows(helpers.shift_cols(helpers.sub_bytes(bytearray(round_keys[-1]))))
+            rc = bytearray(64)
+            rc[0:8] = aes_64_Rcon[round - 1]
+            round_keys.append(bytearray(k[j] ^ rc[j] for j in range(64)))
+
+        state = helpers.add_round_key(bytearray(plaintext), round_keys[0])
+        for round in range(1, 11):
+            state = helpers.mix_rows(helpers.shift_cols(helpers.sub_bytes(state)))
+            state = helpers.add_round_key(state, round_keys[round])
+        return state
+
+    def test_known_answer(self):
+        print("\n===== Testing whirlpool_hash known answers =====")
+        for message, expected in self.expected.items():
+            print(f"{message!r}: matches: {whirlpool_hash(message).hex() == expected}")
+
+    def test_tables_against_step_by_step(self, n_blocks: int = 20):
+        print("\n===== Testing C0..C7 tables against step-by-step rounds =====")
+        cipher = WhirlpoolCipher()
+        matches = True
+        for _ in range(n_blocks):
+            plaintext, key = bytearray(os.urandom(64)), bytearray(os.urandom(64))
+            matches &= cipher.encrypt(plaintext, key) == self.step_by_step_encrypt(plaintext, key)
+        print(f"WhirlpoolCipher.encrypt matches: {matches}")
+
+    def test_streaming(self):
+        print("\n===== Testing streaming Whirlpool object =====")
+        message = os.urandom(1000)
+        for chunk in (1, 63, 64, 65, 300):
+            hasher = Whirlpool()
+            for i in range(0, len(message), chunk):
+                hasher.update(message[i:i + chunk])
+            print(f"Chunks of {chunk}: matches one-shot: {hasher.hexdigest() == whirlpool_hash(message).hex()}")
+
+        prefix = Whirlpool(message[:100])
+        fork = prefix.copy()
+        prefix.update(b"first")
+        fork.update(b"second")
+        print(f"copy() forks the state: {prefix.digest() == whirlpool_hash(message[:100] + b'first') and fork.digest() == whirlpool_hash(message[:100] + b'second')}")
+
+    def test_hash_file(self):
+        print("\n===== Testing mmap hash_file =====")
+        for size in (0, 100, 10000):
+            data = os.urandom(size)
+            with tempfile.NamedTemporaryFile(delete=False) as f:
+                f.write(data)
+            try:
+                print(f"{size} bytes: matches whirlpool_hash: {hash_file(f.name) == whirlpool_hash(data)}")
+                print(f"{size} bytes: sha512 matches hashlib: {hash_file(f.name, 'sha512') == hashlib.sha512(data).digest()}")
+            finally:
+                os.remove(f.name)
+
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(b"abc")
+        try:
+            results = hash_files([os.path.join(tempfile.gettempdir(), "missing-file"), f.name])
+            print(f"Missing file reported, others still hashed: {results[0]['error'] is not None and results[1]['digest'] == whirlpool_hash(b'abc').hex()}")
+        finally:
+            os.remove(f.name)
+
+    def test_tree_hash(self):
+        print("\n===== Testing Whirlpool tree hash =====")
+        data = bytearray(os.urandom(1000))
+        tree = WhirlpoolTree.build(bytes(data), leaf_size=64)
+        print(f"16 leaves, 5 levels: {len(tree.leaves) == 16 and len(tree.levels) == 5}")
+        print(f"Leaf size is bound into the root: {tree.root != whirlpool_tree_hash(bytes(data), leaf_size=128)}")
+        print(f"Process pool matches: {whirlpool_tree_hash(bytes(data), 64, workers=2) == tree.root}")
+
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(data)
+        try:
+            print(f"File path matches bytes: {whirlpool_tree_hash(f.name, 64) == tree.root}")
+        finally:
+            os.remove(f.name)
+
+        data[300] ^= 1
+        data += os.urandom(100)
+        rehashed = tree.rehash(bytes(data), [300 // 64])
+        print(f"Incremental rehash matches full build: {rehashed.levels == WhirlpoolTree.build(bytes(data), 64).levels}")
+        print(f"Unchanged leaves are reused: {rehashed.leaves[:4] == tree.leaves[:4]}")
+
+    def run_all_tests(self):
+        print("======================================")
+        print("Whirlpool Tests")
+        print("======================================")
+        self.test_known_answer()
+        self.test_tables_against_step_by_step()
+        self.test_streaming()
+        self.test_hash_file()
+        self.test_tree_hash()
@@ -8,10 +8,10 @@ from .helpers import hex2bin, bin2hex, bin2dec, dec2bin, hex2dec, dec2hex, text_
 from .helpers import split_half, circular_shift_left
 
 # math functions
-from .helpers import xor, gcd,  binary_gcd, is_prime, extended_gcd, multiplicative_inverse, advanceMod, advanceMod_SM
+from .helpers import xor, gcd,  binary_gcd, is_prime, extended_gcd, multiplicative_inverse, advanceMod, advanceMod_SM, advanceMod_window, FixedBaseModExp, MontgomeryContext, advanceMod_mont
 
 # prime generation functions
-from .helpers import generate_prime_pair, miller_rabin_prime
+from .helpers import generate_prime_pair, miller_rabin_prime, generate_prime, is_probable_prime, miller_rabin_rounds
 
 from .metric_plot import plot_performance_metrics, save_metrics_to_file, load_metrics_from_file
 
@@ -1,3 +1,6 @@
+from functools import lru_cache
+import numpy as np
+
 # ========================================================== AES ==========================================================
 
 # Key size constants
@@ -153,4 +156,283 @@ def galios_multiplication_GF4(a, b, modulus=0x13):
         if hi_bit_set:
             a ^= modulus
         b >>= 1
-    return p & 0xF
\ No newline at end of file
+    return p & 0xF
+
+# Table-driven GF(2^8) arithmetic: log/antilog and full product tables per modulus, and
+# per-column tables for the constant diffusion matrices, all built once and cached.
+
+def gf8_generator(modulus=0x11B):
+    """Smallest element generating the multiplicative group of GF(2^8) for the given modulus."""
+    for g in range(2, 256):
+        x, order = 1, 0
+        while True:
+            x = galois_multiplication_GF8(x, g, modulus)
+            order += 1
+            if x == 1:
+                break
+        if order == 255:
+            return g
+    raise ValueError("Invalid GF(2^8) modulus. It must be irreducible.")
+
+@lru_cache(maxsize=None)
+def gf8_log_tables(modulus=0x11B):
+    """
+    Log/antilog tables of GF(2^8) for the given modulus.
+    Returns:
+        tuple: (exp, log), exp has 510 entries so exp[log[a] + log[b]] needs no reduction mod 255.
+    """
+    g = gf8_generator(modulus)
+    exp, log = [0] * 510, [0] * 256
+    x = 1
+    for i in range(255):
+        exp[i] = exp[i + 255] = x
+        log[x] = i
+        x = galois_multiplication_GF8(x, g, modulus)
+    return exp, log
+
+@lru_cache(maxsize=None)
+def gf8_mul_table(modulus=0x11B):
+    """
+    Full 256x256 product table: gf8_mul_table(modulus)[a][b] == galois_multiplication_GF8(a, b, modulus).
+    Returns:
+        tuple[bytes]: 256 rows of 256 products.
+    """
+    exp, log = gf8_log_tables(modulus)
+    rows = [bytes(256)]
+    for a in range(1, 256):
+        la = log[a]
+        rows.append(bytes([0] + [exp[la + log[b]] for b in range(1, 256)]))
+    return tuple(rows)
+
+@lru_cache(maxsize=None)
+def gf8_matrix_tables(matrix: tuple, modulus=0x11B):
+    """
+    Per-input-byte tables for multiplying a constant matrix by a vector: for input position j,
+    table[j][x] packs (matrix[0][j]*x, ..., matrix[n-1][j]*x) big-endian into one integer,
+    so matrix . v == XOR of table[j][v[j]] over j.
+    Args:
+        matrix (tuple): n x n matrix as a tuple of row tuples (hashable, for the cache).
+        modulus (int): Reduction polynomial.
+    Returns:
+        tuple: n tables of 256 integers.
+    """
+    mul = gf8_mul_table(modulus)
+    n = len(matrix)
+    tables = []
+    for j in range(n):
+        column = [mul[matrix[i][j]] for i in range(n)]
+        tables.append(tuple(int.from_bytes(bytes(row[x] for row in column), 'big') for x in range(256)))
+    return tuple(tables)
+
+MIX_COLUMNS_TABLES = gf8_matrix_tables(tuple(map(tuple, MIX_COLUMNS_MATRIX)))
+INV_MIX_COLUMNS_TABLES = gf8_matrix_tables(tuple(map(tuple, INV_MIX_COLUMNS_MATRIX)))
+MIX_ROWS_TABLES = gf8_matrix_tables(tuple(map(tuple, MIX_ROWS_MATRIX)), modulus=0x11D)
+
+# ========================================================== AES T-tables ==========================================================
+# 32-bit-word formulation of AES: each table entry is SubBytes followed by the column that
+# MixColumns makes out of that byte, so a round is 16 lookups and XORs on the 4 column words.
+
+def aes_build_t_tables():
+    """
+    Build the encryption tables Te0..Te3 (from aes_sbox) and decryption tables Td0..Td3 (from aes_rsbox).
+    Te0[x] = (2s, s, s, 3s) with s = aes_sbox[x], Td0[x] = (14s, 9s, 13s, 11s) with s = aes_rsbox[x];
+    Te1..Te3 / Td1..Td3 are the same words rotated right by 8, 16 and 24 bits.
+    Returns:
+        tuple: (Te, Td), each a list of 4 tables of 256 words.
+    """
+    mul = gf8_mul_table(0x11B)
+
+    def word(s, coefficients):
+        w = 0
+        for c in coefficients:
+            w = (w << 8) | mul[c][s]
+        return w
+
+    def rotations(table):
+        return [table] + [[((w >> (8 * r)) | (w << (32 - 8 * r))) & 0xFFFFFFFF for w in table] for r in (1, 2, 3)]
+
+    Te0 = [word(aes_sbox[x], (0x02, 0x01, 0x01, 0x03)) for x in range(256)]
+    Td0 = [word(aes_rsbox[x], (0x0E, 0x09, 0x0D, 0x0B)) for x in range(256)]
+    return rotations(Te0), rotations(Td0)
+
+(aes_Te0, aes_Te1, aes_Te2, aes_Te3), (aes_Td0, aes_Td1, aes_Td2, aes_Td3) = aes_build_t_tables()
+
+def aes_round_key_words(expanded_key) -> list[int]:
+    """Split an expanded key into 32-bit column words (big-endian, row 0 in the top byte)."""
+    return [int.from_bytes(expanded_key[i:i + 4], 'big') for i in range(0, len(expanded_key), 4)]
+
+def aes_inv_mix_column_word(w: int) -> int:
+    """InvMixColumns of one column word (Td tables undo the S-box, so apply it first)."""
+    return (aes_Td0[aes_sbox[w >> 24]] ^ aes_Td1[aes_sbox[(w >> 16) & 0xFF]]
+            ^ aes_Td2[aes_sbox[(w >> 8) & 0xFF]] ^ aes_Td3[aes_sbox[w & 0xFF]])
+
+def aes_decryption_key_words(words: list[int], rounds: int) -> list[int]:
+    """
+    Round keys for the equivalent inverse cipher: rounds in reverse order, with
+    InvMixColumns applied to every round key except the first and the last.
+    """
+    dk = []
+    for r in range(rounds, -1, -1):
+        round_words = words[4 * r:4 * r + 4]
+        if 0 < r < rounds:
+            round_words = [aes_inv_mix_column_word(w) for w in round_words]
+        dk += round_words
+    return dk
+
+def aes_ttable_encrypt(block, rk: list[int], rounds: int) -> bytes:
+    """Encrypt a 16-byte block with T-tables, rk = round key words (4 * (rounds + 1))."""
+    Te0, Te1, Te2, Te3, sbox = aes_Te0, aes_Te1, aes_Te2, aes_Te3, aes_sbox
+    s0 = int.from_bytes(block[0:4], 'big') ^ rk[0]
+    s1 = int.from_bytes(block[4:8], 'big') ^ rk[1]
+    s2 = int.from_bytes(block[8:12], 'big') ^ rk[2]
+    s3 = int.from_bytes(block[12:16], 'big') ^ rk[3]
+
+    for i in range(4, 4 * rounds, 4):
+        s0, s1, s2, s3 = (
+            Te0[s0 >> 24] ^ Te1[(s1 >> 16) & 0xFF] ^ Te2[(s2 >> 8) & 0xFF] ^ Te3[s3 & 0xFF] ^ rk[i],
+            Te0[s1 >> 24] ^ Te1[(s2 >> 16) & 0xFF] ^ Te2[(s3 >> 8) & 0xFF] ^ Te3[s0 & 0xFF] ^ rk[i + 1],
+            Te0[s2 >> 24] ^ Te1[(s3 >> 16) & 0xFF] ^ Te2[(s0 >> 8) & 0xFF] ^ Te3[s1 & 0xFF] ^ rk[i + 2],
+            Te0[s3 >> 24] ^ Te1[(s0 >> 16) & 0xFF] ^ Te2[(s1 >> 8) & 0xFF] ^ Te3[s2 & 0xFF] ^ rk[i + 3],
+        )
+
+    # Final round (no MixColumns): S-box only
+    i = 4 * rounds
+    return b''.join((
+        ((sbox[s0 >> 24] << 24 | sbox[(s1 >> 16) & 0xFF] << 16 | sbox[(s2 >> 8) & 0xFF] << 8 | sbox[s3 & 0xFF]) ^ rk[i]).to_bytes(4, 'big'),
+        ((sbox[s1 >> 24] << 24 | sbox[(s2 >> 16) & 0xFF] << 16 | sbox[(s3 >> 8) & 0xFF] << 8 | sbox[s0 & 0xFF]) ^ rk[i + 1]).to_bytes(4, 'big'),
+        ((sbox[s2 >> 24] << 24 | sbox[(s3 >> 16) & 0xFF] << 16 | sbox[(s0 >> 8) & 0xFF] << 8 | sbox[s1 & 0xFF]) ^ rk[i + 2]).to_bytes(4, 'big'),
+        ((sbox[s3 >> 24] << 24 | sbox[(s0 >> 16) & 0xFF] << 16 | sbox[(s1 >> 8) & 0xFF] << 8 | sbox[s2 & 0xFF]) ^ rk[i + 3]).to_bytes(4, 'big'),
+    ))
+
+def aes_ttable_decrypt(block, dk: list[int], rounds: int) -> bytes:
+    """Decrypt a 16-byte block with T-tables, dk = round key words from aes_decryption_key_words."""
+    Td0, Td1, Td2, Td3, rsbox = aes_Td0, aes_Td1, aes_Td2, aes_Td3, aes_rsbox
+    s0 = int.from_bytes(block[0:4], 'big') ^ dk[0]
+    s1 = int.from_bytes(block[4:8], 'big') ^ dk[1]
+    s2 = int.from_bytes(block[8:12], 'big') ^ dk[2]
+    s3 = int.from_bytes(block[12:16], 'big') ^ dk[3]
+
+    # InvShiftRows moves row r of column c to column c + r, so each word pulls from the columns to its left
+    for i in range(4, 4 * rounds, 4):
+        s0, s1, s2, s3 = (
+            Td0[s0 >> 24] ^ Td1[(s3 >> 16) & 0xFF] ^ Td2[(s2 >> 8) & 0xFF] ^ Td3[s1 & 0xFF] ^ dk[i],
+            Td0[s1 >> 24] ^ Td1[(s0 >> 16) & 0xFF] ^ Td2[(s3 >> 8) & 0xFF] ^ Td3[s2 & 0xFF] ^ dk[i + 1],
+            Td0[s2 >> 24] ^ Td1[(s1 >> 16) & 0xFF] ^ Td2[(s0 >> 8) & 0xFF] ^ Td3[s3 & 0xFF] ^ dk[i + 2],
+            Td0[s3 >> 24] ^ Td1[(s2 >> 16) & 0xFF] ^ Td2[(s1 >> 8) & 0xFF] ^ Td3[s0 & 0xFF] ^ dk[i + 3],
+        )
+
+    # Final round (no InvMixColumns): inverse S-box only
+    i = 4 * rounds
+    return b''.join((
+        ((rsbox[s0 >> 24] << 24 | rsbox[(s3 >> 16) & 0xFF] << 16 | rsbox[(s2 >> 8) & 0xFF] << 8 | rsbox[s1 & 0xFF]) ^ dk[i]).to_bytes(4, 'big'),
+        ((rsbox[s1 >> 24] << 24 | rsbox[(s0 >> 16) & 0xFF] << 16 | rsbox[(s3 >> 8) & 0xFF] << 8 | rsbox[s2 & 0xFF]) ^ dk[i + 1]).to_bytes(4, 'big'),
+        ((rsbox[s2 >> 24] << 24 | rsbox[(s1 >> 16) & 0xFF] << 16 | rsbox[(s0 >> 8) & 0xFF] << 8 | rsbox[s3 & 0xFF]) ^ dk[i + 2]).to_bytes(4, 'big'),
+        ((rsbox[s3 >> 24] << 24 | rsbox[(s2 >> 16) & 0xFF] << 16 | rsbox[(s1 >> 8) & 0xFF] << 8 | rsbox[s0 & 0xFF]) ^ dk[i + 3]).to_bytes(4, 'big'),
+    ))
+
+# ========================================================== AES on NumPy arrays ==========================================================
+# Vectorized rounds over an (N, 16) uint8 array of blocks in input byte order (byte 4 * col + row):
+# every block advances through each round together.
+
+aes_sbox_np = np.array(aes_sbox, dtype=np.uint8)
+aes_rsbox_np = np.array(aes_rsbox, dtype=np.uint8)
+# Byte i = 4 * col + row of the output comes from column col + row (ShiftRows) / col - row (InvShiftRows)
+AES_SHIFT_ROWS_INDEX = np.array([4 * ((i // 4 + i % 4) % 4) + i % 4 for i in range(16)])
+AES_INV_SHIFT_ROWS_INDEX = np.array([4 * ((i // 4 - i % 4) % 4) + i % 4 for i in range(16)])
+# Products by the InvMixColumns coefficients (xtime is the row for 0x02)
+aes_gf_mul_np = {c: np.frombuffer(gf8_mul_table(0x11B)[c], dtype=np.uint8) for c in (0x02, 0x09, 0x0B, 0x0D, 0x0E)}
+
+def aes_numpy_round_keys(words) -> np.ndarray:
+    """Round key words (4 per round) as a (rounds + 1, 16) uint8 array in input byte order."""
+    return np.frombuffer(b''.join(w.to_bytes(4, 'big') for w in words), dtype=np.uint8).reshape(-1, 16)
+
+def aes_numpy_mix_columns(state: np.ndarray) -> np.ndarray:
+    """MixColumns on an (N, 16) array, with xtime as a table lookup on whole arrays."""
+    xtime = aes_gf_mul_np[0x02]
+    a = state.reshape(-1, 4, 4)
+    a0, a1, a2, a3 = a[:, :, 0], a[:, :, 1], a[:, :, 2], a[:, :, 3]
+    t = a0 ^ a1 ^ a2 ^ a3
+    return np.stack((
+        a0 ^ t ^ xtime[a0 ^ a1],
+        a1 ^ t ^ xtime[a1 ^ a2],
+        a2 ^ t ^ xtime[a2 ^ a3],
+        a3 ^ t ^ xtime[a3 ^ a0],
+    ), axis=2).reshape(-1, 16)
+
+def aes_numpy_inv_mix_columns(state: np.ndarray) -> np.ndarray:
+    """InvMixColumns on an (N, 16) array."""
+    m9, m11, m13, m14 = aes_gf_mul_np[0x09], aes_gf_mul_np[0x0B], aes_gf_mul_np[0x0D], aes_gf_mul_np[0x0E]
+    a = state.reshape(-1, 4, 4)
+    a0, a1, a2, a3 = a[:, :, 0], a[:, :, 1], a[:, :, 2], a[:, :, 3]
+    return np.stack((
+        m14[a0] ^ m11[a1] ^ m13[a2] ^ m9[a3],
+        m9[a0] ^ m14[a1] ^ m11[a2] ^ m13[a3],
+        m13[a0] ^ m9[a1] ^ m14[a2] ^ m11[a3],
+        m11[a0] ^ m13[a1] ^ m9[a2] ^ m14[a3],
+    ), axis=2).reshape(-1, 16)
+
+def aes_numpy_encrypt(blocks: np.ndarray, round_keys: np.ndarray, rounds: int) -> np.ndarray:
+    """Encrypt an (N, 16) uint8 array of blocks; round_keys from aes_numpy_round_keys."""
+    state = blocks ^ round_keys[0]
+    for r in range(1, rounds):
+        state = aes_numpy_mix_columns(aes_sbox_np[state][:, AES_SHIFT_ROWS_INDEX]) ^ round_keys[r]
+    return aes_sbox_np[state][:, AES_SHIFT_ROWS_INDEX] ^ round_keys[rounds]
+
+def aes_numpy_decrypt(blocks: np.ndarray, round_keys: np.ndarray, rounds: int) -> np.ndarray:
+    """Decrypt an (N, 16) uint8 array of blocks; round_keys in encryption order from aes_numpy_round_keys."""
+    state = blocks ^ round_keys[rounds]
+    for r in range(rounds - 1, 0, -1):
+        state = aes_numpy_inv_mix_columns(aes_rsbox_np[state[:, AES_INV_SHIFT_ROWS_INDEX]] ^ round_keys[r])
+    return aes_rsbox_np[state[:, AES_INV_SHIFT_ROWS_INDEX]] ^ round_keys[0]
+
+
+# ========================================================== AES-like 512-bit state on row words ==========================================================
+# The 8x8 state (row-major) as eight 64-bit row words, column 0 in the top byte. ShiftColumns moves
+# column j of row r - j to row r, so one round reads byte j of row r - j for every j. With
+# C_j[x] = MixRows contribution of sbox[x] at column j, SubBytes + ShiftColumns + MixRows is
+# 8 lookups and XORs per row.
+
+aes_64_C = tuple(tuple(MIX_ROWS_TABLES[j][aes_64_sbox[x]] for x in range(256)) for j in range(8))
+# Same gather without MixRows (final round): sbox[x] placed back at column j
+aes_64_S = tuple(tuple(aes_64_sbox[x] << (8 * (7 - j)) for x in range(256)) for j in range(8))
+
+def aes_64_bytes_to_rows(block) -> list[int]:
+    """Split a 64-byte row-major state into 8 row words."""
+    return [int.from_bytes(block[i:i + 8], 'big') for i in range(0, 64, 8)]
+
+def aes_64_rows_to_bytes(rows) -> bytes:
+    """Join 8 row words back into a 64-byte row-major state."""
+    return b''.join(row.to_bytes(8, 'big') for row in rows)
+
+def aes_64_row_round(R, T, K) -> list[int]:
+    """
+    One round on row words: the ShiftColumns gather through the 8 tables T (aes_64_C for
+    SubBytes + ShiftColumns + MixRows, aes_64_S for SubBytes + ShiftColumns), then XOR with K.
+    Args:
+        R (list[int]): 8 row words.
+        T (tuple): 8 tables of 256 words.
+        K (list[int]): 8 round key row words.
+    Returns:
+        list[int]: The 8 new row words.
+    """
+    R0, R1, R2, R3, R4, R5, R6, R7 = R
+    T0, T1, T2, T3, T4, T5, T6, T7 = T
+    return [
+        T0[R0 >> 56] ^ T1[(R7 >> 48) & 0xFF] ^ T2[(R6 >> 40) & 0xFF] ^ T3[(R5 >> 32) & 0xFF] ^ T4[(R4 >> 24) & 0xFF] ^ T5[(R3 >> 16) & 0xFF] ^ T6[(R2 >> 8) & 0xFF] ^ T7[R1 & 0xFF] ^ K[0],
+        T0[R1 >> 56] ^ T1[(R0 >> 48) & 0xFF] ^ T2[(R7 >> 40) & 0xFF] ^ T3[(R6 >> 32) & 0xFF] ^ T4[(R5 >> 24) & 0xFF] ^ T5[(R4 >> 16) & 0xFF] ^ T6[(R3 >> 8) & 0xFF] ^ T7[R2 & 0xFF] ^ K[1],
+        T0[R2 >> 56] ^ T1[(R1 >> 48) & 0xFF] ^ T2[(R0 >> 40) & 0xFF] ^ T3[(R7 >> 32) & 0xFF] ^ T4[(R6 >> 24) & 0xFF] ^ T5[(R5 >> 16) & 0xFF] ^ T6[(R4 >> 8) & 0xFF] ^ T7[R3 & 0xFF] ^ K[2],
+        T0[R3 >> 56] ^ T1[(R2 >> 48) & 0xFF] ^ T2[(R1 >> 40) & 0xFF] ^ T3[(R0 >> 32) & 0xFF] ^ T4[(R7 >> 24) & 0xFF] ^ T5[(R6 >> 16) & 0xFF] ^ T6[(R5 >> 8) & 0xFF] ^ T7[R4 & 0xFF] ^ K[3],
+        T0[R4 >> 56] ^ T1[(R3 >> 48) & 0xFF] ^ T2[(R2 >> 40) & 0xFF] ^ T3[(R1 >> 32) & 0xFF] ^ T4[(R0 >> 24) & 0xFF] ^ T5[(R7 >> 16) & 0xFF] ^ T6[(R6 >> 8) & 0xFF] ^ T7[R5 & 0xFF] ^ K[4],
+        T0[R5 >> 56] ^ T1[(R4 >> 48) & 0xFF] ^ T2[(R3 >> 40) & 0xFF] ^ T3[(R2 >> 32) & 0xFF] ^ T4[(R1 >> 24) & 0xFF] ^ T5[(R0 >> 16) & 0xFF] ^ T6[(R7 >> 8) & 0xFF] ^ T7[R6 & 0xFF] ^ K[5],
+        T0[R6 >> 56] ^ T1[(R5 >> 48) & 0xFF] ^ T2[(R4 >> 40) & 0xFF] ^ T3[(R3 >> 32) & 0xFF] ^ T4[(R2 >> 24) & 0xFF] ^ T5[(R1 >> 16) & 0xFF] ^ T6[(R0 >> 8) & 0xFF] ^ T7[R7 & 0xFF] ^ K[6],
+        T0[R7 >> 56] ^ T1[(R6 >> 48) & 0xFF] ^ T2[(R5 >> 40) & 0xFF] ^ T3[(R4 >> 32) & 0xFF] ^ T4[(R3 >> 24) & 0xFF] ^ T5[(R2 >> 16) & 0xFF] ^ T6[(R1 >> 8) & 0xFF] ^ T7[R0 & 0xFF] ^ K[7],
+    ]
+
+def aes_64_encrypt_rows(block, rk: list[list[int]], rounds: int) -> bytes:
+    """Encrypt a 64-byte block on row words, rk = round keys as 8 row words each (rounds + 1 of them)."""
+    K0 = rk[0]
+    R = [row ^ k for row, k in zip(aes_64_bytes_to_rows(block), K0)]
+    for r in range(1, rounds):
+        R = aes_64_row_round(R, aes_64_C, rk[r])
+    # Final round (no MixRows)
+    return aes_64_rows_to_bytes(aes_64_row_round(R, aes_64_S, rk[rounds]))
@@ -199,13 +199,8 @@ class AES_Helpers:
         Returns:
             bytearray: The mixed column
         """
-        result = bytearray(4)
-        for i in range(4):
-            val = 0
-            for j in range(4):
-                val ^= galois_multiplication_GF8(column[j], MIX_COLUMNS_MATRIX[i][j])
-            result[i] = val
-        return result
+        T0, T1, T2, T3 = MIX_COLUMNS_TABLES
+        return bytearray((T0[column[0]] ^ T1[column[1]] ^ T2[column[2]] ^ T3[column[3]]).to_bytes(4, 'big'))
     
     def mix_columns(self, state):
         """Iterate over the 4 columns and call mix_column() on each"""
@@ -235,13 +230,10 @@ class AES_Helpers:
         Returns:
             bytearray: The mixed row
         """
-        result = bytearray(8)
-        for i in range(8):
-            val = 0
-            for j in range(8):
-                val ^= galois_multiplication_GF8(row[j], MIX_ROWS_MATRIX[i][j], modulus=0x11D) # 0x11D for AES-512
-            result[i] = val
-        return result
+        T = MIX_ROWS_TABLES  # 0x11D for AES-512
+        mixed = (T[0][row[0]] ^ T[1][row[1]] ^ T[2][row[2]] ^ T[3][row[3]]
+                 ^ T[4][row[4]] ^ T[5][row[5]] ^ T[6][row[6]] ^ T[7][row[7]])
+        return bytearray(mixed.to_bytes(8, 'big'))
 
     '''
     def mix_rows(self, state):
@@ -321,13 +313,8 @@ class AES_Helpers:
         Returns:
             bytearray: The mixed column
         """
-        result = bytearray(4)
-        for i in range(4):
-            val = 0
-            for j in range(4):
-                val ^= galois_multiplication_GF8(column[j], INV_MIX_COLUMNS_MATRIX[i][j])
-            result[i] = val
-        return result
+        T0, T1, T2, T3 = INV_MIX_COLUMNS_TABLES
+        return bytearray((T0[column[0]] ^ T1[column[1]] ^ T2[column[2]] ^ T3[column[3]]).to_bytes(4, 'big'))
     
     def inv_mix_columns(self, state):
         """Apply the inverse MixColumns transformation"""
@@ -1,3 +1,6 @@
+from collections import OrderedDict
+import operator
+import threading
 from .helpers import xor, dec2bin, hex2bin, bin2hex, bin2dec, hex2dec, dec2hex, circular_shift_left, split_half
 
 des_initial_permutation = [
@@ -222,3 +225,357 @@ def des_mixer(left: str, right: str, RoundKey: str) -> tuple[str, str]:
     right_des = des_function(right, RoundKey)
     xored = xor(left, right_des)
     return xored, right
+
+
+#============================================== DES INTEGER ENGINE ==============================================
+# Same algorithm as above, but half-blocks are kept as 32-bit ints and RoundKeys as 48-bit ints,
+# so a round is a handful of shifts/masks instead of building '0'/'1' strings.
+
+MASK_28BIT = 0xFFFFFFF
+MASK_32BIT = 0xFFFFFFFF
+
+# S-boxes flattened to 64 entries: the 6-bit input indexes them directly
+# (row = outer bits b1b6, col = inner bits b2b3b4b5).
+des_sbox_flat = [
+    [box[((i >> 4) & 0x2) | (i & 0x1)][(i >> 1) & 0xF] for i in range(64)]
+    for box in des_sbox
+]
+
+def des_permute_int(value: int, arr: list, n: int) -> int:
+    """Permute the bits of an integer with specified P-box.
+    Args:
+        value (int): The value to permute.
+        arr (list[int]): P-box (1-based, MSB first).
+        n (int): Input size in bits.
+    Returns:
+        int: The permuted value (len(arr) bits).
+    """
+    permuted = 0
+    for pos in arr:
+        permuted = (permuted << 1) | ((value >> (n - pos)) & 1)
+    return permuted
+
+class CompiledPermutation:
+    """P-box compiled into per-input-byte lookup tables.
+    Each table maps one input byte to the output bits it contributes, so applying the
+    P-box costs one lookup and OR per input byte instead of one step per output bit.
+    """
+    def __init__(self, arr: list, n: int):
+        """
+        Args:
+            arr (list[int]): P-box (1-based, MSB first).
+            n (int): Input size in bits (multiple of 8).
+        """
+        if n % 8 != 0:
+            raise ValueError("Input size of a compiled permutation must be a multiple of 8 bits.")
+        self.arr = arr
+        self.n = n
+        self.out_size = len(arr)
+        self.shifts = [n - 8 * (i + 1) for i in range(n // 8)]
+        self.tables = [[des_permute_int(byte << shift, arr, n) for byte in range(256)] for shift in self.shifts]
+        self._pairs = list(zip(self.shifts, self.tables))
+
+    def __call__(self, value: int) -> int:
+        """Permute value (n bits) and return the permuted value (len(arr) bits)."""
+        permuted = 0
+        for shift, table in self._pairs:
+            permuted |= table[(value >> shift) & 0xFF]
+        return permuted
+
+    def __repr__(self):
+        return f"CompiledPermutation({self.n} -> {self.out_size} bits)"
+
+des_ip_compiled = CompiledPermutation(des_initial_permutation, 64)
+des_fp_compiled = CompiledPermutation(des_final_permutation, 64)
+des_pc1_compiled = CompiledPermutation(des_parity_drop, 64)
+des_pc2_compiled = CompiledPermutation(des_compression_permutation, 56)
+
+def des_key_generation_int(key: int) -> list[int]:
+    """Generate RoundKeys for the DES algorithm.
+    Args:
+        key (int): Key to generate RoundKey (64 bits).
+    Returns:
+        list[int]: List of 16 RoundKey (48 bits).
+    """
+    permuted = des_pc1_compiled(key)
+    left, right = permuted >> 28, permuted & MASK_28BIT
+    RoundKeys = []
+
+    for shift in des_shift_table:
+        left = ((left << shift) | (left >> (28 - shift))) & MASK_28BIT
+        right = ((right << shift) | (right >> (28 - shift))) & MASK_28BIT
+        RoundKeys.append(des_pc2_compiled((left << 28) | right))
+
+    return RoundKeys
+
+def des_build_sp_table() -> list[list[int]]:
+    """Build the combined S-box/Straight P-box ("SP") tables.
+    Entry [i][chunk] is the output of S-box i for the 6-bit chunk, moved to its nibble and
+    passed through the straight P-box. The P-box only moves bits, so the DES function output
+    is the OR of the 8 entries.
+    Returns:
+        list[list[int]]: 8 tables of 64 entries (32 bits).
+    """
+    return [
+        [des_permute_int(des_sbox_flat[i][chunk] << (28 - 4 * i), des_straight_permutation, 32) for chunk in range(64)]
+        for i in range(8)
+    ]
+
+des_sp_table = des_build_sp_table()
+
+def des_function_int(right: int, RoundKey: int) -> int:
+    """DES function: In -> Expansion P-box -> XOR RoundKey -> SP tables -> Out.
+    Args:
+        right (int): Right half (32 bits).
+        RoundKey (int): Key of each round (48 bits).
+    Returns:
+        int: The result of the DES function (32 bits).
+    """
+    # Expansion P-box: wrap bit 32 in front and bit 1 behind, then every 6-bit group starts 4 bits apart
+    expanded = ((right & 1) << 33) | (right << 1) | (right >> 31)
+    sp0, sp1, sp2, sp3, sp4, sp5, sp6, sp7 = des_sp_table
+    return (sp0[((expanded >> 28) ^ (RoundKey >> 42)) & 0x3F]
+            | sp1[((expanded >> 24) ^ (RoundKey >> 36)) & 0x3F]
+            | sp2[((expanded >> 20) ^ (RoundKey >> 30)) & 0x3F]
+            | sp3[((expanded >> 16) ^ (RoundKey >> 24)) & 0x3F]
+            | sp4[((expanded >> 12) ^ (RoundKey >> 18)) & 0x3F]
+            | sp5[((expanded >> 8) ^ (RoundKey >> 12)) & 0x3F]
+            | sp6[((expanded >> 4) ^ (RoundKey >> 6)) & 0x3F]
+            | sp7[(expanded ^ RoundKey) & 0x3F])
+
+def des_process_block_int(block: int, RoundKeys: list[int]) -> int:
+    """Run one 64-bit block through IP, the 16 rounds and FP.
+    Args:
+        block (int): The block to process (64 bits).
+        RoundKeys (list[int]): 16 RoundKey (48 bits), reversed for decryption.
+    Returns:
+        int: The processed block (64 bits).
+    """
+    permuted = des_ip_compiled(block)
+    left, right = permuted >> 32, permuted & MASK_32BIT
+    sp0, sp1, sp2, sp3, sp4, sp5, sp6, sp7 = des_sp_table
+    for RoundKey in RoundKeys:
+        # des_function_int inlined
+        expanded = ((right & 1) << 33) | (right << 1) | (right >> 31)
+        left, right = right, left ^ (sp0[((expanded >> 28) ^ (RoundKey >> 42)) & 0x3F]
+                                     | sp1[((expanded >> 24) ^ (RoundKey >> 36)) & 0x3F]
+                                     | sp2[((expanded >> 20) ^ (RoundKey >> 30)) & 0x3F]
+                                     | sp3[((expanded >> 16) ^ (RoundKey >> 24)) & 0x3F]
+                                     | sp4[((expanded >> 12) ^ (RoundKey >> 18)) & 0x3F]
+                                     | sp5[((expanded >> 8) ^ (RoundKey >> 12)) & 0x3F]
+                                     | sp6[((expanded >> 4) ^ (RoundKey >> 6)) & 0x3F]
+                                     | sp7[(expanded ^ RoundKey) & 0x3F])
+    # The last round has no swap, so undo it when combining
+    return des_fp_compiled((right << 32) | left)
+
+class DESKeyScheduleCache:
+    """Bounded LRU cache of expanded DES key schedules, keyed by the 64-bit key value.
+    Each entry holds the forward RoundKeys (encryption) and the reversed ones (decryption).
+    """
+    def __init__(self, maxsize: int = 128):
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._schedules = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+        """Return (forward, reversed) RoundKeys for key, expanding it on a miss."""
+        with self._lock:
+            schedules = self._schedules.get(key)
+            if schedules is not None:
+                self._schedules.move_to_end(key)
+                self.hits += 1
+                return schedules
+            self.misses += 1
+
+        RoundKeys = tuple(des_key_generation_int(key))
+        schedules = (RoundKeys, RoundKeys[::-1])
+
+        with self._lock:
+            self._schedules[key] = schedules
+            self._schedules.move_to_end(key)
+            while len(self._schedules) > self.maxsize:
+                self._schedules.popitem(last=False)
+        return schedules
+
+    def encryption_keys(self, key: int) -> tuple[int, ...]:
+        """RoundKeys in encryption order."""
+        return self.get(key)[0]
+
+    def decryption_keys(self, key: int) -> tuple[int, ...]:
+        """RoundKeys in decryption order."""
+        return self.get(key)[1]
+
+    def resize(self, maxsize: int):
+        """Change the capacity, evicting the least recently used schedules if needed."""
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1.")
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._schedules) > maxsize:
+                self._schedules.popitem(last=False)
+
+    def clear(self):
+        """Drop every schedule and reset the counters."""
+        with self._lock:
+            self._schedules.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict:
+        """Hit/miss counters and occupancy, to help size the cache."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._schedules), 'maxsize': self.maxsize}
+
+    def __len__(self):
+        return len(self._schedules)
+
+    def __getstate__(self):
+        # Locks cannot be pickled (e.g. when a DES instance is sent to a worker process): send an empty cache
+        return {'maxsize': self.maxsize}
+
+    def __setstate__(self, state):
+        self.__init__(state['maxsize'])
+
+# Shared by every DES instance (and so by TripleDES) unless one is given its own cache
+des_key_schedule_cache = DESKeyScheduleCache()
+
+
+#============================================== BITSLICED DES ==============================================
+# Bit j of every block is kept in one Python int (a "slice") whose bit i belongs to block i,
+# so every big-int AND/OR/XOR advances the same gate for all blocks at once. P-boxes and the
+# expansion P-box become plain reindexing of the slices and the S-boxes become gate lists.
+
+# Slice registers used by the S-box gate lists: inputs b1..b6, then all-zeros and all-ones
+DES_SLICE_ZERO = 6
+DES_SLICE_ONES = 7
+
+# Order in which the S-box inputs are split on (0 = b1); found by an exhaustive search over
+# the 720 orders, it gives the shortest gate list for each box
+des_bitslice_sbox_order = [
+    (1, 4, 5, 3, 2, 0), (1, 4, 5, 3, 0, 2), (0, 4, 1, 2, 3, 5), (5, 0, 1, 2, 3, 4),
+    (0, 2, 4, 1, 3, 5), (0, 2, 3, 4, 1, 5), (1, 5, 4, 3, 2, 0), (4, 5, 0, 3, 2, 1),
+]
+
+def des_sbox_circuit(box: list[int], order: tuple = (0, 1, 2, 3, 4, 5)) -> tuple[list[tuple], list[int]]:
+    """Compile a flattened S-box into a list of gates on slices.
+    The 4 output bits are built as multiplexer trees over the inputs, with constant
+    branches folded and identical sub-trees shared.
+    Args:
+        box (list[int]): Flattened S-box (64 entries of 4 bits).
+        order (tuple[int]): Order in which the inputs are split on.
+    Returns:
+        tuple[list[tuple], list[int]]: Gates (op, register, register), each appending one register
+        after the 8 input registers, and the registers holding the 4 output bits (MSB first).
+    """
+    gates, gate_ids, sub_trees = [], {}, {}
+
+    def gate(op, a, b):
+        if a > b:
+            a, b = b, a
+        if (op, a, b) not in gate_ids:
+            gates.append((op, a, b))
+            gate_ids[(op, a, b)] = 8 + len(gates) - 1
+        return gate_ids[(op, a, b)]
+
+    def build(truth: tuple, depth: int) -> int:
+        if not any(truth):
+            return DES_SLICE_ZERO
+        if all(truth):
+            return DES_SLICE_ONES
+        if (depth, truth) in sub_trees:
+            return sub_trees[(depth, truth)]
+        half = len(truth) // 2
+        select = order[depth]
+        low, high = build(truth[:half], depth + 1), build(truth[half:], depth + 1)
+        if low == high:
+            result = low
+        elif low == DES_SLICE_ZERO and high == DES_SLICE_ONES:
+            result = select
+        elif low == DES_SLICE_ONES and high == DES_SLICE_ZERO:
+            result = gate(operator.xor, select, DES_SLICE_ONES)
+        elif low == DES_SLICE_ZERO:
+            result = gate(operator.and_, select, high)
+        elif high == DES_SLICE_ZERO:
+            result = gate(operator.and_, gate(operator.xor, select, DES_SLICE_ONES), low)
+        elif high == DES_SLICE_ONES:
+            result = gate(operator.or_, select, low)
+        elif low == DES_SLICE_ONES:
+            result = gate(operator.or_, gate(operator.xor, select, DES_SLICE_ONES), high)
+        else:
+            result = gate(operator.xor, low, gate(operator.and_, select, gate(operator.xor, low, high)))
+        sub_trees[(depth, truth)] = result
+        return result
+
+    outputs = []
+    for bit in range(4):
+        truth = []
+        for index in range(64):
+            chunk = 0
+            for depth in range(6):
+                if (index >> (5 - depth)) & 1:
+                    chunk |= 1 << (5 - order[depth])
+            truth.append((box[chunk] >> (3 - bit)) & 1)
+        outputs.append(build(tuple(truth), 0))
+    return gates, outputs
+
+des_sbox_circuits = [des_sbox_circuit(box, order) for box, order in zip(des_sbox_flat, des_bitslice_sbox_order)]
+
+def des_round_key_positions() -> list[list[int]]:
+    """For every round, the key bit (1-based, MSB first) that lands on each RoundKey bit.
+    The key schedule only moves bits, so a bitsliced key schedule is just this reindexing.
+    Returns:
+        list[list[int]]: 16 lists of 48 key positions.
+    """
+    positions = [[0] * 48 for _ in range(16)]
+    for pos in range(1, 65):
+        for round, RoundKey in enumerate(des_key_generation_int(1 << (64 - pos))):
+            for bit in range(48):
+                if (RoundKey >> (47 - bit)) & 1:
+                    positions[round][bit] = pos
+    return positions
+
+des_round_key_slice_positions = des_round_key_positions()
+
+def des_bitslice(values: list[int], width: int) -> list[int]:
+    """Transpose N values into width slices (slice 0 = MSB); bit i of a slice belongs to values[i]."""
+    if not values:
+        return [0] * width
+    rows = [format(value, f'0{width}b') for value in reversed(values)]
+    return [int(''.join(column), 2) for column in zip(*rows)]
+
+def des_unbitslice(slices: list[int], n: int) -> list[int]:
+    """Inverse of des_bitslice: rebuild the n values held in the slices."""
+    columns = [format(value, f'0{n}b') for value in slices]
+    return [int(''.join(bits), 2) for bits in zip(*columns)][::-1]
+
+def des_process_slices(block_slices: list[int], round_key_slices: list[list[int]], ones: int) -> list[int]:
+    """Run bitsliced blocks through IP, the 16 rounds and FP.
+    Args:
+        block_slices (list[int]): 64 slices of the input blocks (MSB first).
+        round_key_slices (list[list[int]]): 16 lists of 48 slices, one per RoundKey bit.
+        ones (int): Slice with a 1 for every block in the batch.
+    Returns:
+        list[int]: 64 slices of the output blocks.
+    """
+    permuted = [block_slices[pos - 1] for pos in des_initial_permutation]
+    left, right = permuted[:32], permuted[32:]
+    expansion = [pos - 1 for pos in des_expansion_permutation]
+    straight = [pos - 1 for pos in des_straight_permutation]
+
+    for RoundKey in round_key_slices:
+        xored = [right[pos] ^ key_bit for pos, key_bit in zip(expansion, RoundKey)]
+        substituted = []
+        for i, (gates, outputs) in enumerate(des_sbox_circuits):
+            registers = xored[6 * i:6 * i + 6]
+            registers += (0, ones)
+            for op, a, b in gates:
+                registers.append(op(registers[a], registers[b]))
+            substituted += [registers[out] for out in outputs]
+        left, right = right, [left[j] ^ substituted[pos] for j, pos in enumerate(straight)]
+
+    combined = right + left
+    return [combined[pos - 1] for pos in des_final_permutation]
@@ -1,4 +1,4 @@
-from .helpers import multiplicative_inverse
+from .helpers import multiplicative_inverse, MontgomeryContext
 import random
 import hashlib
 
@@ -68,11 +68,16 @@ class EllipticCurveGFp:
     """
     Class representing an Elliptic Curve over GF(p) in the form y^2 = x^3 + ax + b
     """
-    def __init__(self, a, b, p):
-        """Initialize with curve parameters a, b and prime p."""
+    def __init__(self, a, b, p, montgomery = False):
+        """Initialize with curve parameters a, b and prime p.
+        If montgomery is True, multiply_point works in Jacobian coordinates on Montgomery-form
+        field elements (one inversion per scalar multiplication instead of one per point operation).
+        """
         self.a = FieldElementGFp(a, p)
         self.b = FieldElementGFp(b, p)
         self.p = p
+        self.mont = MontgomeryContext(p) if montgomery else None
+        self._a_mont = self.mont.to_mont(a) if montgomery else None
         
         # Check that the curve is non-singular
         # Discriminant Δ = -16(4a^3 + 27b^2) must not be 0
@@ -169,6 +174,12 @@ class EllipticCurveGFp:
             
         if scalar == 0:
             return None  # 0*P = point at infinity
+
+        if self.mont is not None:
+            if not self.is_on_curve(point):
+                print("Error adding points during scalar multiplication: Points must be on the curve")
+                return None
+            return self._multiply_point_jacobian(point, scalar)
         
         result = None  # Initialize with the point at infinity
         addend = point
@@ -193,6 +204,58 @@ class EllipticCurveGFp:
         
         return result
     
+    def _double_jacobian(self, P):
+        """2P for a Jacobian point (X, Y, Z) in Montgomery form (x = X/Z^2, y = Y/Z^3)."""
+        if P is None:
+            return None
+        X, Y, Z = P
+        if Y == 0:
+            return None
+        mul, p = self.mont.mont_mul, self.p
+        YY = mul(Y, Y)
+        S = 4 * mul(X, YY) % p
+        ZZ = mul(Z, Z)
+        M = (3 * mul(X, X) + mul(self._a_mont, mul(ZZ, ZZ))) % p
+        X3 = (mul(M, M) - 2 * S) % p
+        Y3 = (mul(M, S - X3) - 8 * mul(YY, YY)) % p
+        return (X3, Y3, 2 * mul(Y, Z) % p)
+
+    def _add_jacobian_affine(self, P, Q):
+        """P + Q for a Jacobian point P and an affine point Q = (x, y), both in Montgomery form."""
+        x2, y2 = Q
+        if P is None:
+            return (x2, y2, self.mont.one)
+        X1, Y1, Z1 = P
+        mul, p = self.mont.mont_mul, self.p
+        Z1Z1 = mul(Z1, Z1)
+        H = (mul(x2, Z1Z1) - X1) % p
+        r = (mul(y2, mul(Z1, Z1Z1)) - Y1) % p
+        if H == 0:
+            return self._double_jacobian(P) if r == 0 else None
+        HH = mul(H, H)
+        HHH = mul(H, HH)
+        V = mul(X1, HH)
+        X3 = (mul(r, r) - HHH - 2 * V) % p
+        Y3 = (mul(r, V - X3) - mul(Y1, HHH)) % p
+        return (X3, Y3, mul(Z1, H))
+
+    def _multiply_point_jacobian(self, point, scalar):
+        """scalar * point (scalar > 0) by MSB-first double-and-add, converting back with a single inversion."""
+        mont = self.mont
+        Q = (mont.to_mont(point[0]), mont.to_mont(point[1]))
+        result = None
+        for i in range(scalar.bit_length() - 1, -1, -1):
+            result = self._double_jacobian(result)
+            if (scalar >> i) & 1:
+                result = self._add_jacobian_affine(result, Q)
+        if result is None:
+            return None
+
+        X, Y, Z = (mont.from_mont(v) for v in result)
+        z_inv = multiplicative_inverse(Z, self.p)
+        z_inv2 = z_inv * z_inv % self.p
+        return (X * z_inv2 % self.p, Y * z_inv2 * z_inv % self.p)
+
 class FieldElementGF2n:
     """
     Class representing an element in GF(2^n) field.
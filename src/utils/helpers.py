@@ -1,7 +1,9 @@
 import random
 import string
 import math
-import sympy
+import os
+import secrets
+from concurrent.futures import ProcessPoolExecutor
 from typing import Union
 
 MAX_64BIT = 0xffffffffffffffff
@@ -133,6 +135,10 @@ def rotate_right(n, r):
 def shift_left(n, r):
     return n << r
 
+def shift_right(n, r):
+    """Logical right shift of a 64-bit word."""
+    return (n & MAX_64BIT) >> r
+
 def is_prime(n):
     """
     Check if a number is prime.
@@ -245,6 +251,189 @@ def advanceMod_SM(a, b, c):
 
     return result
 
+def window_size(bits):
+    """Sliding-window width for an exponent of the given bit length (the thresholds OpenSSL uses)."""
+    for threshold, k in ((671, 6), (239, 5), (79, 4), (23, 3)):
+        if bits > threshold:
+            return k
+    return 1
+
+def odd_powers(a, c, k):
+    """
+    Table of odd powers for a window of width k.
+    Returns:
+        list: [a^1, a^3, a^5, ..., a^(2^k - 1)] mod c.
+    """
+    a %= c
+    powers = [a]
+    if k > 1:
+        a2 = (a * a) % c
+        for _ in range((1 << (k - 1)) - 1):
+            powers.append((powers[-1] * a2) % c)
+    return powers
+
+def advanceMod_window(a, b, c, k = None, powers = None):
+    '''
+    Calculate a^b mod c using sliding-window exponentiation (MSB to LSB).
+    Runs of zero bits cost one squaring per bit; each window of up to k bits ending in a 1 costs
+    its squarings plus a single multiplication by a precomputed odd power of a.
+    Args:
+        a (int): The base.
+        b (int): The exponent.
+        c (int): The modulus.
+        k (int): Window width (default: window_size(b.bit_length())).
+        powers (list): Odd powers of a from odd_powers(a, c, k), to reuse across exponents.
+    Returns:
+        int: a^b mod c.
+    '''
+    if c == 1:
+        return 0
+    if k is None:
+        k = window_size(b.bit_length())
+    if powers is None:
+        powers = odd_powers(a, c, k)
+
+    result = 1
+    i = b.bit_length() - 1
+    while i >= 0:
+        if not (b >> i) & 1:
+            result = (result * result) % c
+            i -= 1
+            continue
+        # Longest window [i, j] of at most k bits that ends in a 1
+        j = max(i - k + 1, 0)
+        while not (b >> j) & 1:
+            j += 1
+        for _ in range(i - j + 1):
+            result = (result * result) % c
+        result = (result * powers[((b >> j) & ((1 << (i - j + 1)) - 1)) >> 1]) % c
+        i = j - 1
+
+    return result
+
+class FixedBaseModExp:
+    """
+    a^b mod c for one fixed base and modulus and many exponents: the odd powers of a are
+    computed once, for the widest window any exponent up to max_bits needs.
+    """
+    def __init__(self, a, c, max_bits = None):
+        self.base, self.modulus = a % c, c
+        self.k = window_size(max_bits if max_bits is not None else c.bit_length())
+        self.powers = odd_powers(a, c, self.k)
+
+    def pow(self, b):
+        return advanceMod_window(self.base, b, self.modulus, self.k, self.powers)
+
+class MontgomeryContext:
+    """
+    Montgomery arithmetic modulo one odd n, with R = 2^bits (bits = n.bit_length()).
+    Numbers live in Montgomery form aR mod n; a product is reduced by REDC, which needs only
+    masks, shifts and two multiplications instead of a division by n.
+    Attributes:
+        n (int): The modulus.
+        bits (int): log2(R).
+        R2 (int): R^2 mod n, to enter Montgomery form.
+        n_prime (int): -n^-1 mod R.
+        one (int): 1 in Montgomery form (R mod n).
+    """
+    def __init__(self, modulus):
+        if modulus < 3 or modulus % 2 == 0:
+            raise ValueError("Invalid Montgomery modulus. It must be odd and at least 3.")
+        self.n = modulus
+        self.bits = modulus.bit_length()
+        self.mask = (1 << self.bits) - 1
+        self.R2 = (1 << (2 * self.bits)) % modulus
+        self.n_prime = (-multiplicative_inverse(modulus, 1 << self.bits)) & self.mask
+        self.one = (1 << self.bits) % modulus
+
+    def reduce(self, T):
+        """REDC: T * R^-1 mod n, for 0 <= T < n * R."""
+        t = (T + (((T & self.mask) * self.n_prime) & self.mask) * self.n) >> self.bits
+        return t - self.n if t >= self.n else t
+
+    def to_mont(self, a):
+        return self.reduce((a % self.n) * self.R2)
+
+    def from_mont(self, a):
+        return self.reduce(a)
+
+    def mont_mul(self, a, b):
+        return self.reduce(a * b)
+
+    def mont_sqr(self, a):
+        return self.reduce(a * a)
+
+    def ladder(self, a, b):
+        """
+        a^b mod n with the Montgomery ladder: one multiplication and one squaring per exponent
+        bit, whatever its value.
+        """
+        r0, r1 = self.one, self.to_mont(a)
+        for i in range(b.bit_length() - 1, -1, -1):
+            if (b >> i) & 1:
+                r0, r1 = self.reduce(r0 * r1), self.reduce(r1 * r1)
+            else:
+                r0, r1 = self.reduce(r0 * r0), self.reduce(r0 * r1)
+        return self.from_mont(r0)
+
+    def pow(self, a, b):
+        """a^b mod n with sliding windows (as advanceMod_window) over Montgomery products."""
+        k = window_size(b.bit_length())
+        reduce = self.reduce
+        base = self.to_mont(a)
+        powers = [base]
+        if k > 1:
+            base2 = reduce(base * base)
+            for _ in range((1 << (k - 1)) - 1):
+                powers.append(reduce(powers[-1] * base2))
+
+        result = self.one
+        i = b.bit_length() - 1
+        while i >= 0:
+            if not (b >> i) & 1:
+                result = reduce(result * result)
+                i -= 1
+                continue
+            j = max(i - k + 1, 0)
+            while not (b >> j) & 1:
+                j += 1
+            for _ in range(i - j + 1):
+                result = reduce(result * result)
+            result = reduce(result * powers[((b >> j) & ((1 << (i - j + 1)) - 1)) >> 1])
+            i = j - 1
+        return self.from_mont(result)
+
+def advanceMod_mont(a, b, c, context = None):
+    '''
+    Calculate a^b mod c in Montgomery form (sliding windows).
+    Args:
+        a (int): The base.
+        b (int): The exponent.
+        c (int): The modulus (odd).
+        context (MontgomeryContext): Precomputed context for c, to reuse across calls.
+    Returns:
+        int: a^b mod c.
+    '''
+    if context is None:
+        context = MontgomeryContext(c)
+    return context.pow(a, b)
+
+def crt_mod_exp(c, p, q, dP, dQ, qInv):
+    '''
+    Calculate c^d mod p*q from two half-size exponentiations (CRT) and Garner recombination.
+    Args:
+        c (int): The base.
+        p, q (int): The prime factors of the modulus.
+        dP, dQ (int): d mod (p - 1) and d mod (q - 1).
+        qInv (int): q^-1 mod p.
+    Returns:
+        int: c^d mod p*q.
+    '''
+    m1 = advanceMod_window(c % p, dP, p)
+    m2 = advanceMod_window(c % q, dQ, q)
+    h = (qInv * (m1 - m2)) % p
+    return m2 + h * q
+
 def extended_gcd(a, b):
     """Extended Euclidean Algorithm
     Returns (gcd, s, t) such that s*a + t*b = gcd(a, b)"""
@@ -277,67 +466,141 @@ def multiplicative_inverse(e, t):
     else:
         return x % t
 
-def generate_prime_pair(bit_size = 32):
+def _sieve_primes(limit):
+    """All primes below limit (sieve of Eratosthenes)."""
+    sieve = bytearray([1]) * limit
+    sieve[0:2] = b'\x00\x00'
+    for i in range(2, math.isqrt(limit - 1) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit, i)))
+    return tuple(i for i in range(limit) if sieve[i])
+
+# Trial-division table: candidates divisible by one of these never reach a Miller-Rabin round
+SMALL_PRIMES = _sieve_primes(2048)
+
+def miller_rabin_rounds(bit_size):
+    """
+    Miller-Rabin rounds for a random candidate of bit_size bits, so that a composite passes with
+    probability below 2^-80 (HAC Table 4.4); larger candidates need fewer rounds.
+    """
+    for bits, rounds in ((1300, 2), (850, 3), (650, 4), (550, 5), (450, 6), (400, 7), (350, 8),
+                         (300, 9), (250, 12), (200, 15), (150, 18), (100, 27)):
+        if bit_size >= bits:
+            return rounds
+    return 40
+
+def is_probable_prime(n, rounds = None):
+    """
+    Trial division by SMALL_PRIMES, then Miller-Rabin with random bases.
+    Args:
+        n (int): The number to test.
+        rounds (int): Miller-Rabin rounds (default: miller_rabin_rounds(n.bit_length())).
+    Returns:
+        bool: False if n is composite, True if n is (probably) prime.
+    """
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < SMALL_PRIMES[-1] ** 2:
+        return True
+    if rounds is None:
+        rounds = miller_rabin_rounds(n.bit_length())
+
+    # Write n as 2^r·d + 1
+    r, d = 0, n - 1
+    while d % 2 == 0:
+        r += 1
+        d //= 2
+
+    # Witness loop
+    for _ in range(rounds):
+        a = random.randint(2, n - 2)
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(r - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def generate_prime(bit_size, e = None, rounds = None, window = 4096):
+    """
+    Generate a random prime of exactly bit_size bits with its two top bits set, so the product
+    of two such primes has exactly 2 * bit_size bits.
+    Starting from a random odd candidate, the next window odd numbers are sieved against
+    SMALL_PRIMES at once, and only the survivors get Miller-Rabin rounds.
+    Args:
+        bit_size (int): The bit size of the prime.
+        e (int): If given, only accept p with gcd(e, p - 1) = 1 (an RSA public exponent).
+        rounds (int): Miller-Rabin rounds (default: adaptive by bit size).
+        window (int): Number of odd candidates sieved per batch.
+    Returns:
+        int: A probable prime.
+    """
+    if bit_size < 2:
+        raise ValueError("Invalid prime size. It must be at least 2 bits.")
+    # The candidate comes from the OS generator: worker processes forked from one parent share the random state
+    top = 0b11 << (bit_size - 2) if bit_size > 2 else 0b10
+    while True:
+        start = top | secrets.randbits(bit_size) | 1
+        start &= (1 << bit_size) - 1
+        if bit_size <= 11:
+            # Too small to sieve: the candidates may themselves be in SMALL_PRIMES
+            if is_probable_prime(start, rounds) and (e is None or gcd(e, start - 1) == 1):
+                return start
+            continue
+
+        # sieve[i] stands for start + 2i
+        sieve = bytearray([1]) * window
+        for p in SMALL_PRIMES[1:]:
+            # First i with start + 2i = 0 (mod p), i.e. i = -start / 2 (mod p)
+            first = (-start * (p + 1) // 2) % p
+            sieve[first::p] = bytes(len(range(first, window, p)))
+        for i in range(window):
+            candidate = start + 2 * i
+            if not sieve[i] or candidate >> bit_size:
+                continue
+            if e is not None and gcd(e, candidate - 1) != 1:
+                continue
+            if is_probable_prime(candidate, rounds):
+                return candidate
+
+def generate_prime_pair(bit_size = 32, e = None, workers = 1):
     """Generate two different prime numbers of specified bit size
     Args:
         bit_size (int): The bit size of the primes to generate, default = 32.
+        e (int): If given, both p - 1 and q - 1 are coprime to it (an RSA public exponent).
+        workers (int): If above 1, p and q are searched for in two worker processes.
     Returns:
         tuple: (p, q) - Two different prime numbers
     """
-    # Generate first prime
-    p = sympy.randprime(2**(bit_size-1), 2**bit_size)
-    
-    # Generate second prime (ensure it's different from p)
-    q = sympy.randprime(2**(bit_size-1), 2**bit_size)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            p, q = pool.map(generate_prime, [bit_size] * 2, [e] * 2)
+    else:
+        p, q = generate_prime(bit_size, e), generate_prime(bit_size, e)
+
+    # Ensure q is different from p
     while p == q:
-        q = sympy.randprime(2**(bit_size-1), 2**bit_size)
-    
+        q = generate_prime(bit_size, e)
     return p, q
-    
-def miller_rabin_prime(bit_size, k=40):
+
+def miller_rabin_prime(bit_size, k = None):
     """Generate a prime number of specified bit size using Miller-Rabin test
-    
+
     Args:
     bit_size (int): The bit size of the prime to generate
-    k (int): Number of iterations for Miller-Rabin test
-    
+    k (int): Number of iterations for Miller-Rabin test (default: adaptive by bit size)
+
     Returns:
     int: A probable prime number
     """
-    def is_probably_prime(n, k=40):
-        """Miller-Rabin primality test"""
-        if n == 2 or n == 3:
-            return True
-        if n <= 1 or n % 2 == 0:
-            return False
-            
-        # Write n as 2^r·d + 1
-        r, d = 0, n - 1
-        while d % 2 == 0:
-            r += 1
-            d //= 2
-            
-        # Witness loop
-        for _ in range(k):
-            a = random.randint(2, n - 2)
-            x = pow(a, d, n)
-            if x == 1 or x == n - 1:
-                continue
-            for _ in range(r - 1):
-                x = pow(x, 2, n)
-                if x == n - 1:
-                    break
-            else:
-                return False
-        return True
-        
-    # Generate a random odd number of the specified bit size
-    while True:
-        # Generate a random number with the top bit set (to ensure bit_size bits)
-        # and bottom bit set (to ensure odd number)
-        p = (1 << (bit_size - 1)) | random.getrandbits(bit_size - 2) | 1
-        if is_probably_prime(p, k):
-            return p
+    return generate_prime(bit_size, rounds=k)
 
 def z26_to_char(num: int) -> str:
     """Convert a number in Z_26 group (0 - 25) to its corresponding character.
@@ -365,13 +628,17 @@ def text_to_z26(text: str, one_at_a_time: bool = True):
         num_str = ''.join([f"{ord(char) - 97:02d}" for char in text.lower()]) # zeropad each converted char to 2 digits
         return int(num_str)
 
-def whirlpool_pad(message: bytes) -> bytes:
+def whirlpool_pad(message: bytes, length: int = None) -> bytes:
     """
     Pad message for Whirlpool hash:
       Append a single '1' bit, then '0' bits to make length ≡ 256 mod 512,
       then append 256-bit (32 bytes) length field.
+    length: total message length in bytes when message is only its unprocessed tail
+      (streaming); defaults to len(message).
     """
-    ml = len(message) * 8  # message length in bits
+    if length is None:
+        length = len(message)
+    ml = length * 8  # message length in bits
     # Append '1' bit (0x80), then as many '0' bits as needed
     pad = b'\x80'
     pad_len = (512 - ((ml + 8 + 256) % 512)) % 512  # bits to next 256 mod 512, minus 8 bits for 0x80
@@ -380,6 +647,19 @@ def whirlpool_pad(message: bytes) -> bytes:
     length_field = ml.to_bytes(32, byteorder='big')
     return message + pad + length_field
 
+def sha512_pad(message: bytes, length: int = None) -> bytes:
+    """
+    Pad message for SHA-512:
+      Append a single '1' bit, then '0' bits to make length ≡ 896 mod 1024,
+      then append 128-bit (16 bytes) length field.
+    length: total message length in bytes when message is only its unprocessed tail
+      (streaming); defaults to len(message).
+    """
+    if length is None:
+        length = len(message)
+    pad = b'\x80' + b'\x00' * ((111 - len(message)) % 128)
+    return message + pad + (length * 8).to_bytes(16, byteorder='big')
+
 def generate_random_string(length: int = 16) -> str:
     """Generate a random string of specified length."""
     return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
@@ -394,5 +674,29 @@ def pad_data(data: Union[str, bytes], block_size: int = 16) -> bytes:
 
 def unpad_data(data: bytes) -> bytes:
     """Remove padding from data."""
+    if not data:
+        raise ValueError("Invalid padding: empty data.")
     padding_length = data[-1]
-    return data[:-padding_length]
\ No newline at end of file
+    if padding_length == 0 or padding_length > len(data) or data[-padding_length:] != bytes([padding_length] * padding_length):
+        raise ValueError("Invalid padding.")
+    return data[:-padding_length]
+
+def rsa_pkcs1_pad(block: bytes, k: int) -> bytes:
+    """
+    PKCS#1 v1.5 encryption padding (type 2): 0x00 0x02 || random nonzero bytes || 0x00 || block,
+    k bytes in total, so at most k - 11 bytes of data fit.
+    """
+    if len(block) > k - 11:
+        raise ValueError(f"Invalid RSA block. At most {k - 11} bytes fit a {k}-byte modulus.")
+    length = k - 3 - len(block)
+    ps = bytes(b for b in os.urandom(length + 16) if b)
+    while len(ps) < length:
+        ps += bytes(b for b in os.urandom(16) if b)
+    return b'\x00\x02' + ps[:length] + b'\x00' + block
+
+def rsa_pkcs1_unpad(block: bytes) -> bytes:
+    """Remove PKCS#1 v1.5 encryption padding (type 2)."""
+    separator = block.find(b'\x00', 2)
+    if block[:2] != b'\x00\x02' or separator < 10:
+        raise ValueError("Invalid RSA padding.")
+    return block[separator + 1:]
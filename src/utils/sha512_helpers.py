@@ -1,4 +1,5 @@
 from .helpers import *
+import numpy as np
 # A0, B0, C0, D0, E0, F0, G0, H0
 H_const = [ 0x6a09e667f3bcc908, 0xbb67ae8584caa73b,
             0x3c6ef372fe94f82b, 0xa54ff53a5f1d36f1, 
@@ -49,26 +50,121 @@ def sha512_sigma0(x):
     return (rotate_right(x, 28) ^ rotate_right(x, 34) ^ rotate_right(x, 39))
 
 
-# def sha512_sigma1(x):
-#     return (rotate_right(x, 14) ^ rotate_right(x, 18) ^ rotate_right(x, 41))
+def sha512_sigma1(x):
+    return (rotate_right(x, 14) ^ rotate_right(x, 18) ^ rotate_right(x, 41))
 
 
 def sha512_delta0(x):
-    return (rotate_right(x, 1) ^ rotate_right(x, 8) ^ shift_left(x, 7))
+    return (rotate_right(x, 1) ^ rotate_right(x, 8) ^ shift_right(x, 7))
 
 
 def sha512_delta1(x):
-    return (rotate_right(x, 19) ^ rotate_right(x, 61) ^ shift_left(x, 6))
+    return (rotate_right(x, 19) ^ rotate_right(x, 61) ^ shift_right(x, 6))
 
 
 def sha512_Y(e, f, g, h, k, w):
-    return (h + sha512_sigma0(e) + sha512_conditionnal(e, f, g) + k + w) & MAX_64BIT
+    return (h + sha512_sigma1(e) + sha512_conditionnal(e, f, g) + k + w) & MAX_64BIT
 
 
 def sha512_X(a, b, c):
     return (sha512_sigma0(a) + sha512_Majority(a, b, c)) & MAX_64BIT
 
 
+def sha512_compress(H: list[int], block) -> list[int]:
+    """
+    SHA-512 compression of one block.
+    The 80-word schedule is expanded up front and the rounds run on local variables with the
+    rotations inlined; eight rounds are unrolled so a..h rotate by renaming instead of moving.
+    SHA_512 keeps the step-by-step, printable version of the same rounds.
+    Args:
+        H (list[int]): Chaining value, 8 words.
+        block (sequence[int]): The 16 message words of the block.
+    Returns:
+        list[int]: The new chaining value.
+    """
+    # x * D puts a second copy of x above bit 64, so rotate_right(x, n) == (x * D >> n) & M. Bits above 64
+    # only ever reach additions that are reduced mod 2^64, so the rotations are left unmasked
+    M, D, K = MAX_64BIT, 0x10000000000000001, K_const
+
+    # Message schedule
+    W = list(block)
+    for t in range(16, NUM_ROUNDS):
+        x, y = W[t - 15] * D, W[t - 2] * D
+        W.append(((x >> 1 ^ x >> 8 ^ W[t - 15] >> 7) + (y >> 19 ^ y >> 61 ^ W[t - 2] >> 6) + W[t - 7] + W[t - 16]) & M)
+
+    a, b, c, d, e, f, g, h = H
+    for t in range(0, NUM_ROUNDS, 8):
+        x = e * D
+        t1 = h + (x >> 14 ^ x >> 18 ^ x >> 41) + (g ^ (e & (f ^ g))) + K[t] + W[t]
+        d = (d + t1) & M
+        x = a * D
+        h = (t1 + (x >> 28 ^ x >> 34 ^ x >> 39) + ((a & b) | (c & (a | b)))) & M
+        x = d * D
+        t1 = g + (x >> 14 ^ x >> 18 ^ x >> 41) + (f ^ (d & (e ^ f))) + K[t + 1] + W[t + 1]
+        c = (c + t1) & M
+        x = h * D
+        g = (t1 + (x >> 28 ^ x >> 34 ^ x >> 39) + ((h & a) | (b & (h | a)))) & M
+        x = c * D
+        t1 = f + (x >> 14 ^ x >> 18 ^ x >> 41) + (e ^ (c & (d ^ e))) + K[t + 2] + W[t + 2]
+        b = (b + t1) & M
+        x = g * D
+        f = (t1 + (x >> 28 ^ x >> 34 ^ x >> 39) + ((g & h) | (a & (g | h)))) & M
+        x = b * D
+        t1 = e + (x >> 14 ^ x >> 18 ^ x >> 41) + (d ^ (b & (c ^ d))) + K[t + 3] + W[t + 3]
+        a = (a + t1) & M
+        x = f * D
+        e = (t1 + (x >> 28 ^ x >> 34 ^ x >> 39) + ((f & g) | (h & (f | g)))) & M
+        x = a * D
+        t1 = d + (x >> 14 ^ x >> 18 ^ x >> 41) + (c ^ (a & (b ^ c))) + K[t + 4] + W[t + 4]
+        h = (h + t1) & M
+        x = e * D
+        d = (t1 + (x >> 28 ^ x >> 34 ^ x >> 39) + ((e & f) | (g & (e | f)))) & M
+        x = h * D
+        t1 = c + (x >> 14 ^ x >> 18 ^ x >> 41) + (b ^ (h & (a ^ b))) + K[t + 5] + W[t + 5]
+        g = (g + t1) & M
+        x = d * D
+        c = (t1 + (x >> 28 ^ x >> 34 ^ x >> 39) + ((d & e) | (f & (d | e)))) & M
+        x = g * D
+        t1 = b + (x >> 14 ^ x >> 18 ^ x >> 41) + (a ^ (g & (h ^ a))) + K[t + 6] + W[t + 6]
+        f = (f + t1) & M
+        x = c * D
+        b = (t1 + (x >> 28 ^ x >> 34 ^ x >> 39) + ((c & d) | (e & (c | d)))) & M
+        x = f * D
+        t1 = a + (x >> 14 ^ x >> 18 ^ x >> 41) + (h ^ (f & (g ^ h))) + K[t + 7] + W[t + 7]
+        e = (e + t1) & M
+        x = b * D
+        a = (t1 + (x >> 28 ^ x >> 34 ^ x >> 39) + ((b & c) | (d & (b | c)))) & M
+
+    return [(H[0] + a) & M, (H[1] + b) & M, (H[2] + c) & M, (H[3] + d) & M,
+            (H[4] + e) & M, (H[5] + f) & M, (H[6] + g) & M, (H[7] + h) & M]
+
+
+def sha512_compress_lanes(H: list, block) -> list:
+    """
+    SHA-512 compression of one block in each of L independent lanes (one message per lane).
+    The sha512_* helpers above run unchanged on NumPy uint64 arrays, whose additions wrap mod 2^64.
+    Args:
+        H (list[np.ndarray]): Chaining value, 8 uint64 arrays of L lanes.
+        block (np.ndarray): (16, L) uint64 message words, row t = word t of every lane.
+    Returns:
+        list[np.ndarray]: The new chaining value.
+    """
+    # Message schedule
+    W = list(block)
+    for t in range(16, NUM_ROUNDS):
+        W.append(sha512_delta1(W[t - 2]) + W[t - 7] + sha512_delta0(W[t - 15]) + W[t - 16])
+
+    a, b, c, d, e, f, g, h = H
+    for t in range(NUM_ROUNDS):
+        y = sha512_Y(e, f, g, h, K_lanes[t], W[t])
+        x = sha512_X(a, b, c)
+        a, b, c, d, e, f, g, h = y + x, a, b, c, d + y, e, f, g
+
+    return [H[i] + v for i, v in enumerate((a, b, c, d, e, f, g, h))]
+
+K_lanes = np.array(K_const, dtype=np.uint64)
+
+
 def sha512_compare_digests(digest, expected):
     if (digest != expected):
         print("Error:")